@@ -4,14 +4,39 @@ Two joke agents battle it out. An impartial (but dramatic) Judge scores them.
 Uses the LLM-as-a-Judge evaluation pattern for AI comedy critique.
 """
 
+import asyncio
+import functools
 import os
+import re
 import sys
 import json
+
+import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import llm_cache
+import ratelimit
+import semcache
 
 load_dotenv()
 
+# HTTP/2 multiplexes the parallel joke + judge requests over one TLS
+# connection; it needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Safety net for models that wrap JSON in markdown fences despite
+# json_object mode — single pass, no intermediate strings
+_FENCE_RE = re.compile(r"^```(?:json)?\n(.*?)\n```\s*$", re.S)
+
 # ── Agent System Prompts ─────────────────────────────────────────────
 
 KNOCK_KNOCK_PROMPT = """\
@@ -102,6 +127,19 @@ Be brutally honest but entertaining. You live for this.
 
 # ── Core Functions ────────────────────────────────────────────────────
 
+def _report_prompt_cache(usage) -> None:
+    """Show provider prefix-cache hits when LLM_DEBUG=1.
+
+    The static system prompts lead every request, so the API can serve
+    them from its prompt cache — this makes the savings visible.
+    """
+    if os.getenv("LLM_DEBUG") != "1" or usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details else None
+    if cached is not None:
+        print(f"  [cache] {cached}/{usage.prompt_tokens} prompt tokens served from prefix cache")
+
 def get_azure_config() -> tuple[str, str, str, str]:
     """Load and validate Azure OpenAI configuration."""
     endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -127,32 +165,72 @@ def get_azure_config() -> tuple[str, str, str, str]:
     return endpoint, api_key, deployment, api_version
 
 
-def create_client() -> AzureOpenAI:
-    """Create and return an Azure OpenAI client."""
+@functools.lru_cache(maxsize=1)
+def create_client() -> AsyncAzureOpenAI:
+    """Create (once) and return the shared async Azure OpenAI client.
+
+    Cached so library-style callers reuse the same connection pool.
+    """
     endpoint, api_key, _, api_version = get_azure_config()
-    return AzureOpenAI(
+    return AsyncAzureOpenAI(
         api_key=api_key,
         azure_endpoint=endpoint,
         api_version=api_version,
+        http_client=httpx.AsyncClient(
+            http2=HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ),
     )
 
 
-def get_joke(client: AzureOpenAI, system_prompt: str, user_prompt: str) -> str:
+async def get_joke(client: AsyncAzureOpenAI, system_prompt: str, user_prompt: str) -> str:
     """Get a joke from an agent given a user prompt."""
     _, _, deployment, _ = get_azure_config()
-    response = client.chat.completions.create(
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+    cache_key = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.make_key(deployment, messages, temperature=1.0, max_tokens=512)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    sem_ns = semcache.namespace_for(system_prompt)
+    sem_hit = semcache.lookup(sem_ns, user_prompt)
+    if sem_hit is not None:
+        return sem_hit
+
+    await ratelimit.throttle_async(messages)
+
+    # Stream so token generation overlaps network I/O across the two agents
+    stream = await client.chat.completions.create(
         model=deployment,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
+        messages=messages,
         temperature=1.0,
         max_tokens=512,
+        stream=True,
+        stream_options={"include_usage": True},
     )
-    return response.choices[0].message.content
-
-
-def judge_jokes(client: AzureOpenAI, user_prompt: str, joke_a: str, joke_b: str) -> dict:
+    parts = []
+    usage = None
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+        if chunk.usage:
+            usage = chunk.usage
+    _report_prompt_cache(usage)
+    joke = "".join(parts)
+    if cache_key is not None:
+        llm_cache.set(cache_key, joke)
+    semcache.store(sem_ns, user_prompt, joke)
+    return joke
+
+
+async def judge_jokes(client: AsyncAzureOpenAI, user_prompt: str, joke_a: str, joke_b: str) -> dict:
     """Have the Judge evaluate both jokes and return structured scores."""
     judging_prompt = f"""\
 The user asked: "{user_prompt}"
@@ -166,23 +244,48 @@ The user asked: "{user_prompt}"
 Now judge them. Return ONLY valid JSON."""
 
     _, _, deployment, _ = get_azure_config()
-    response = client.chat.completions.create(
+    messages = [
+        {"role": "system", "content": JUDGE_PROMPT},
+        {"role": "user", "content": judging_prompt},
+    ]
+
+    cache_key = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.make_key(deployment, messages, temperature=0.7, max_tokens=512)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+    await ratelimit.throttle_async(messages)
+
+    # json_object mode guarantees valid JSON — no fences to strip, no
+    # retry on parse failure. The scoreboard is small, so 512 tokens is plenty.
+    stream = await client.chat.completions.create(
         model=deployment,
-        messages=[
-            {"role": "system", "content": JUDGE_PROMPT},
-            {"role": "user", "content": judging_prompt},
-        ],
+        messages=messages,
         temperature=0.7,
-        max_tokens=1024,
+        max_tokens=512,
+        response_format={"type": "json_object"},
+        stream=True,
+        stream_options={"include_usage": True},
     )
-
-    raw = response.choices[0].message.content.strip()
-    # Strip markdown code fences if the model wraps them anyway
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1]  # remove first line
-        raw = raw.rsplit("```", 1)[0]  # remove last fence
-
-    return json.loads(raw)
+    parts = []
+    usage = None
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+        if chunk.usage:
+            usage = chunk.usage
+    _report_prompt_cache(usage)
+
+    raw = "".join(parts).strip()
+    m = _FENCE_RE.match(raw)
+    if m:
+        raw = m.group(1)
+    scores = orjson.loads(raw)
+    if cache_key is not None:
+        llm_cache.set(cache_key, orjson.dumps(scores).decode())
+    return scores
 
 
 def print_scoreboard(scores: dict) -> None:
@@ -232,7 +335,15 @@ def print_leaderboard(wins: dict, rounds: int) -> None:
 
 # ── Main Loop ─────────────────────────────────────────────────────────
 
-def main() -> None:
+async def _prompt_user(session: PromptSession) -> str | None:
+    """Read a topic without blocking the event loop. None signals exit."""
+    try:
+        return (await session.prompt_async("🎤 You: ")).strip()
+    except (EOFError, KeyboardInterrupt):
+        return None
+
+
+async def main() -> None:
     print("=" * 55)
     print("🏟️  C O M E D Y   A R E N A  🏟️")
     print("    Knock Knock Agent 🚪  vs  Dad Joke Agent 👨")
@@ -246,14 +357,17 @@ def main() -> None:
     wins = {"A": 0, "B": 0, "TIE": 0}
     rounds = 0
 
+    session = PromptSession(history=FileHistory(".arena_history"))
+    input_task = asyncio.create_task(_prompt_user(session))
+
     while True:
-        try:
-            user_input = input("🎤 You: ").strip()
-        except (EOFError, KeyboardInterrupt):
+        user_input = await input_task
+
+        if user_input is None:
             print("\n👋 The arena is closed. Thanks for watching!")
             break
-
         if not user_input:
+            input_task = asyncio.create_task(_prompt_user(session))
             continue
         if user_input.lower() in ("quit", "exit"):
             print("👋 The arena is closed. Thanks for watching!")
@@ -263,19 +377,22 @@ def main() -> None:
         print(f"\n🔔 ROUND {rounds} — FIGHT!")
         print("-" * 55)
 
-        # Both agents generate jokes in sequence
-        print("\n🚪 Knock Knock Agent is thinking...")
-        joke_a = get_joke(client, KNOCK_KNOCK_PROMPT, user_input)
+        # Both agents generate jokes concurrently — no data dependency
+        print("\n🚪🥊👨 Both agents are thinking...")
+        joke_a, joke_b = await asyncio.gather(
+            get_joke(client, KNOCK_KNOCK_PROMPT, user_input),
+            get_joke(client, DAD_JOKE_PROMPT, user_input),
+        )
         print(f"\n🚪 Knock Knock Agent:\n{joke_a}")
-
-        print("\n👨 Dad Joke Agent is thinking...")
-        joke_b = get_joke(client, DAD_JOKE_PROMPT, user_input)
         print(f"\n👨 Dad Joke Agent:\n{joke_b}")
 
-        # Judge evaluates
-        print("\n⚖️  The Judge is deliberating...")
+        # Pipeline the rounds: the Judge deliberates while the user types
+        # the next topic, hiding judge latency behind human think-time
+        print("\n⚖️  The Judge is deliberating... (type your next topic anytime)")
+        judge_task = asyncio.create_task(judge_jokes(client, user_input, joke_a, joke_b))
+        input_task = asyncio.create_task(_prompt_user(session))
         try:
-            scores = judge_jokes(client, user_input, joke_a, joke_b)
+            scores = await judge_task
             print_scoreboard(scores)
             wins[scores["winner"]] = wins.get(scores["winner"], 0) + 1
         except (json.JSONDecodeError, KeyError) as e:
@@ -286,4 +403,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,13 +3,45 @@ Dad Joke Agent 👨‍👧‍👦😎
 Every response is delivered as a dad joke!
 """
 
+import functools
 import os
 import sys
+from collections import deque
+
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import llm_cache
+import ratelimit
+import semcache
 
 load_dotenv()
 
+# HTTP/2 multiplexes concurrent requests over one TLS connection; it
+# needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# tiktoken gives exact token counts for trimming; fall back to ~4 chars
+# per token when it isn't installed
+try:
+    import tiktoken
+    try:
+        _ENCODER = tiktoken.encoding_for_model(os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+    except KeyError:
+        _ENCODER = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _ENCODER = None
+
+TOKEN_BUDGET = 4000  # max prompt tokens shipped per request
+
 SYSTEM_PROMPT = """\
 You are the Dad Joke Agent. You MUST respond to EVERY user message \
 using one or more dad jokes. Your entire reply must be structured as \
@@ -34,24 +66,113 @@ Rules:
 """
 
 
+@functools.lru_cache(maxsize=1)
 def create_client() -> OpenAI:
-    """Create and return an OpenAI client."""
+    """Create (once) and return the shared OpenAI client.
+
+    Cached so library-style callers reuse the same connection pool.
+    """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         print("❌  Missing OPENAI_API_KEY. Copy .env.example to .env and add your key.")
         sys.exit(1)
-    return OpenAI(api_key=api_key)
+    return OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(
+            http2=HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ),
+    )
+
+
+def _count_tokens(text: str) -> int:
+    if _ENCODER is not None:
+        return len(_ENCODER.encode(text))
+    return len(text) // 4
+
+
+def _trim_conversation(conversation: list[dict]) -> list[dict]:
+    """Keep the system prompt plus the newest messages within TOKEN_BUDGET.
+
+    Without this, every turn ships the whole history — O(n²) token cost
+    over a session and an eventual context-length error.
+    """
+    system, rest = conversation[0], conversation[1:]
+    budget = TOKEN_BUDGET - _count_tokens(system["content"])
+    kept: list[dict] = []
+    for message in reversed(rest):
+        cost = _count_tokens(message["content"]) + 4
+        if cost > budget:
+            break
+        budget -= cost
+        kept.append(message)
+    kept.reverse()
+    return [system, *kept]
+
+
+def _report_prompt_cache(usage) -> None:
+    """Show provider prefix-cache hits when LLM_DEBUG=1.
+
+    The static system prompt leads every request, so the API can serve
+    it from its prompt cache — this makes the savings visible.
+    """
+    if os.getenv("LLM_DEBUG") != "1" or usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details else None
+    if cached is not None:
+        print(f"  [cache] {cached}/{usage.prompt_tokens} prompt tokens served from prefix cache")
 
 
 def chat(client: OpenAI, conversation: list[dict]) -> str:
-    """Send the conversation to the model and return the assistant reply."""
-    response = client.chat.completions.create(
-        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+    """Send the conversation to the model, echoing tokens as they stream in.
+
+    Returns the full assistant reply (cached replies are echoed at once).
+    """
+    model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    conversation = _trim_conversation(conversation)
+
+    cache_key = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.make_key(model, conversation, temperature=1.0, max_tokens=1024)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            print(cached)
+            return cached
+
+    sem_ns = semcache.namespace_for(SYSTEM_PROMPT)
+    user_input = conversation[-1]["content"]
+    sem_hit = semcache.lookup(sem_ns, user_input)
+    if sem_hit is not None:
+        print(sem_hit)
+        return sem_hit
+
+    ratelimit.throttle(conversation)
+
+    stream = client.chat.completions.create(
+        model=model,
         messages=conversation,
         temperature=1.0,   # keep it creative
         max_tokens=1024,
+        stream=True,   # show the first token ASAP instead of blocking
+        stream_options={"include_usage": True},
     )
-    return response.choices[0].message.content
+    parts = []
+    usage = None
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            print(chunk.choices[0].delta.content, end="", flush=True)
+            parts.append(chunk.choices[0].delta.content)
+        if chunk.usage:
+            usage = chunk.usage
+    print()
+    _report_prompt_cache(usage)
+    reply = "".join(parts)
+    if cache_key is not None:
+        llm_cache.set(cache_key, reply)
+    semcache.store(sem_ns, user_input, reply)
+    return reply
 
 
 def main() -> None:
@@ -62,11 +183,13 @@ def main() -> None:
     print('Type "quit" or "exit" to leave.\n')
 
     client = create_client()
-    conversation: list[dict] = [{"role": "system", "content": SYSTEM_PROMPT}]
+    session = PromptSession(history=FileHistory(".dadjokes_history"))
+    # Bounded history: O(1) appends, memory stays flat over a long session
+    history: deque[dict] = deque(maxlen=20)
 
     while True:
         try:
-            user_input = input("You: ").strip()
+            user_input = session.prompt("You: ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\n👋 Hi Goodbye, I'm Dad!")
             break
@@ -77,11 +200,12 @@ def main() -> None:
             print("👋 Hi Goodbye, I'm Dad!")
             break
 
-        conversation.append({"role": "user", "content": user_input})
+        history.append({"role": "user", "content": user_input})
+        conversation = [{"role": "system", "content": SYSTEM_PROMPT}, *history]
+        print("\n👨 Dad:")
         reply = chat(client, conversation)
-        conversation.append({"role": "assistant", "content": reply})
-
-        print(f"\n👨 Dad:\n{reply}\n")
+        history.append({"role": "assistant", "content": reply})
+        print()
 
 
 if __name__ == "__main__":
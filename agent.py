@@ -9,16 +9,26 @@ Uses Ollama's OpenAI-compatible API with an agentic tool-use loop:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
+import orjson
 from dotenv import load_dotenv
+from prompt_toolkit import PromptSession
+from prompt_toolkit.history import FileHistory
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
+import llm_cache
 from tools import execute_tool, get_tool_definitions
 
 # ---------------------------------------------------------------------------
@@ -32,6 +42,20 @@ OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
 MODEL = os.environ.get("OLLAMA_MODEL", "qwen2.5:7b")
 MAX_TURNS = 15  # safety limit on agentic loop iterations
 
+# Tools are I/O-bound (shell/web/files) — run independent calls concurrently
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
+# One client for the process: keep-alive + connection pooling to Ollama
+# instead of a fresh TCP handshake per request
+_HTTP_CLIENT = httpx.Client(
+    timeout=httpx.Timeout(300.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+)
+atexit.register(_HTTP_CLIENT.close)
+
+# Serialize chat bodies with orjson instead of httpx's stdlib-json path
+_JSON_HEADERS = {"content-type": "application/json"}
+
 SYSTEM_PROMPT = """\
 You are a helpful, capable AI assistant with a sharp sense of humor. You have \
 access to tools that let you run shell commands, read/write files, do math, get \
@@ -43,8 +67,13 @@ Think step-by-step. When you have a final answer, respond directly to the user.\
 """
 
 
+@functools.lru_cache(maxsize=1)
 def _build_tool_params() -> list[dict]:
-    """Return tool definitions in OpenAI function-calling format."""
+    """Return tool definitions in OpenAI function-calling format.
+
+    The registry is fixed for the process lifetime, so build the list once
+    instead of on every user turn.
+    """
     return get_tool_definitions()
 
 
@@ -53,23 +82,71 @@ def _build_tool_params() -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-def _chat_completion(messages: list[dict], tools: list[dict]) -> dict:
-    """Call Ollama's /api/chat endpoint and return the parsed response."""
+def _chat_completion(
+    messages: list[dict],
+    tools: list[dict],
+    on_content=None,
+) -> dict:
+    """Call Ollama's /api/chat endpoint and return the parsed response.
+
+    With an on_content callback, the request streams and each content
+    delta is forwarded as it arrives; the aggregated response is still
+    returned so the agent loop is unchanged.
+    """
     payload: dict = {
         "model": MODEL,
         "messages": messages,
-        "stream": False,
+        "stream": on_content is not None,
     }
     if tools:
         payload["tools"] = tools
 
-    resp = httpx.post(
-        f"{OLLAMA_BASE_URL}/api/chat",
-        json=payload,
-        timeout=300,  # local models can be slow
-    )
-    resp.raise_for_status()
-    return resp.json()
+    cache_key = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.make_key(MODEL, messages, tools=tools)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            response = orjson.loads(cached)
+            if on_content is not None and response.get("message", {}).get("content"):
+                on_content(response["message"]["content"])
+            return response
+
+    if on_content is None:
+        resp = _HTTP_CLIENT.post(
+            f"{OLLAMA_BASE_URL}/api/chat",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        resp.raise_for_status()
+        response = orjson.loads(resp.content)
+    else:
+        content_parts: list[str] = []
+        tool_calls: list[dict] = []
+        with _HTTP_CLIENT.stream(
+            "POST",
+            f"{OLLAMA_BASE_URL}/api/chat",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                msg = chunk.get("message", {})
+                delta = msg.get("content") or ""
+                if delta:
+                    content_parts.append(delta)
+                    on_content(delta)
+                if msg.get("tool_calls"):
+                    tool_calls.extend(msg["tool_calls"])
+        response = {"message": {"content": "".join(content_parts)}}
+        if tool_calls:
+            response["message"]["tool_calls"] = tool_calls
+
+    if cache_key is not None:
+        llm_cache.set(cache_key, orjson.dumps(response).decode())
+    return response
 
 
 # ---------------------------------------------------------------------------
@@ -77,11 +154,12 @@ def _chat_completion(messages: list[dict], tools: list[dict]) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def run_agent(user_input: str, messages: list[dict]) -> str:
+def run_agent(user_input: str, messages: list[dict], on_content=None) -> str:
     """
     Run the agentic loop: send messages to the model, execute any tool calls,
     and repeat until a final text response is produced.
-    Returns the assistant's final text reply.
+    Returns the assistant's final text reply. An optional on_content
+    callback receives streamed content deltas for live rendering.
     """
     tool_defs = _build_tool_params()
 
@@ -89,7 +167,7 @@ def run_agent(user_input: str, messages: list[dict]) -> str:
     messages.append({"role": "user", "content": user_input})
 
     for turn in range(MAX_TURNS):
-        response = _chat_completion(messages, tool_defs)
+        response = _chat_completion(messages, tool_defs, on_content=on_content)
         assistant_msg = response.get("message", {})
 
         # Normalize: Ollama returns content as string (may be empty)
@@ -106,7 +184,9 @@ def run_agent(user_input: str, messages: list[dict]) -> str:
         if not tool_calls:
             return content or "(no response)"
 
-        # Execute each tool call
+        # Parse all tool calls, then execute them concurrently — independent
+        # calls shouldn't block each other
+        parsed_calls = []
         for tc in tool_calls:
             func_info = tc.get("function", {})
             tool_name = func_info.get("name", "")
@@ -114,16 +194,23 @@ def run_agent(user_input: str, messages: list[dict]) -> str:
             # Ollama may pass arguments as dict or JSON string
             if isinstance(tool_args, str):
                 try:
-                    tool_args = json.loads(tool_args)
-                except json.JSONDecodeError:
+                    tool_args = orjson.loads(tool_args)
+                except orjson.JSONDecodeError:
                     tool_args = {}
 
             console.print(
                 f"  [dim]⚙ Calling tool:[/dim] [bold cyan]{tool_name}[/bold cyan]"
-                f"[dim]({json.dumps(tool_args, ensure_ascii=False)[:120]})[/dim]"
+                f"[dim]({orjson.dumps(tool_args).decode()[:120]})[/dim]"
             )
+            parsed_calls.append((tool_name, tool_args))
 
-            result = execute_tool(tool_name, tool_args)
+        futures = [
+            _TOOL_EXECUTOR.submit(execute_tool, tool_name, tool_args)
+            for tool_name, tool_args in parsed_calls
+        ]
+        # Collect in submission order so tool results line up with tool calls
+        for future in futures:
+            result = future.result()
 
             console.print(f"  [dim]✓ Result:[/dim] [green]{result[:200]}[/green]")
 
@@ -142,12 +229,90 @@ def run_agent(user_input: str, messages: list[dict]) -> str:
 # ---------------------------------------------------------------------------
 
 
+# A healthy probe result is cached briefly so repeated checks (library
+# callers, loops) don't re-hit /api/tags every time. Failures are never
+# cached — a transient outage shouldn't pin "down" for the TTL.
+_OLLAMA_HEALTH_TTL = float(os.environ.get("OLLAMA_HEALTH_TTL", "30"))
+_ollama_healthy_at: float | None = None
+# Single-flight: concurrent callers on a cold cache share one probe
+# instead of each opening a socket against a possibly-slow Ollama
+_probe_lock = threading.Lock()
+
+# The healthy result is also persisted so separate CLI invocations within
+# the TTL skip the probe entirely, not just calls within one process
+_HEALTH_CACHE_PATH = os.path.join(
+    os.path.expanduser(os.environ.get("XDG_CACHE_HOME", "~/.cache")),
+    "allthevibes",
+    "backend.json",
+)
+
+
+def _read_disk_health() -> bool:
+    try:
+        with open(_HEALTH_CACHE_PATH) as fh:
+            data = json.load(fh)
+        return time.time() < data.get("ollama_healthy_until", 0)
+    except (OSError, ValueError):
+        return False
+
+
+def _write_disk_health() -> None:
+    try:
+        os.makedirs(os.path.dirname(_HEALTH_CACHE_PATH), exist_ok=True)
+        tmp = _HEALTH_CACHE_PATH + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"ollama_healthy_until": time.time() + _OLLAMA_HEALTH_TTL}, fh)
+        os.replace(tmp, _HEALTH_CACHE_PATH)  # atomic — no torn reads
+    except OSError:
+        pass
+
+
+def invalidate_ollama_cache() -> None:
+    """Force the next _check_ollama() to probe again."""
+    global _ollama_healthy_at
+    _ollama_healthy_at = None
+    try:
+        os.unlink(_HEALTH_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def _check_ollama() -> bool:
     """Verify Ollama is reachable and the model is available."""
+    global _ollama_healthy_at
+
+    def _fresh() -> bool:
+        return (
+            _ollama_healthy_at is not None
+            and time.monotonic() - _ollama_healthy_at < _OLLAMA_HEALTH_TTL
+        )
+
+    if _fresh():
+        return True
+    with _probe_lock:
+        # Whoever held the lock may have just probed for us
+        if _fresh():
+            return True
+        if _read_disk_health():  # another process probed recently
+            _ollama_healthy_at = time.monotonic()
+            return True
+        return _probe_ollama()
+
+
+def _probe_ollama() -> bool:
+    global _ollama_healthy_at
     try:
-        resp = httpx.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=5)
+        # Cheap liveness check first: /api/version is a few bytes and a
+        # dead/absent server on loopback fails in microseconds, so a
+        # tight timeout means fast failure instead of hanging for the
+        # full request timeout before we even ask about models
+        _HTTP_CLIENT.get(
+            f"{OLLAMA_BASE_URL}/api/version",
+            timeout=httpx.Timeout(0.5, connect=0.25),
+        )
+        resp = _HTTP_CLIENT.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=5)
         resp.raise_for_status()
-        models = [m["name"] for m in resp.json().get("models", [])]
+        models = [m["name"] for m in orjson.loads(resp.content).get("models", [])]
         # Check if our model (or a variant with :latest) is available
         model_base = MODEL.split(":")[0]
         available = any(model_base in m for m in models)
@@ -158,8 +323,10 @@ def _check_ollama() -> bool:
                 f"Pull it with: [bold]ollama pull {MODEL}[/bold]"
             )
             return False
+        _ollama_healthy_at = time.monotonic()
+        _write_disk_health()
         return True
-    except httpx.ConnectError:
+    except (httpx.ConnectError, httpx.TimeoutException):
         console.print(
             f"[red bold]Error:[/red bold] Cannot connect to Ollama at "
             f"[bold]{OLLAMA_BASE_URL}[/bold].\n"
@@ -185,10 +352,11 @@ def main():
     )
 
     messages: list[dict] = [{"role": "system", "content": SYSTEM_PROMPT}]
+    session = PromptSession(history=FileHistory(".agent_history"))
 
     while True:
         try:
-            user_input = console.input("\n[bold blue]You:[/bold blue] ").strip()
+            user_input = session.prompt("\nYou: ").strip()
         except (EOFError, KeyboardInterrupt):
             console.print("\n[dim]Goodbye![/dim]")
             break
@@ -199,11 +367,21 @@ def main():
             console.print("[dim]Goodbye![/dim]")
             break
 
-        with console.status("[bold green]Thinking...[/bold green]"):
-            reply = run_agent(user_input, messages)
-
         console.print()
-        console.print(Panel(Markdown(reply), title="🤖 Agent", border_style="green"))
+        buf: list[str] = []
+        with Live(
+            Panel(Markdown(""), title="🤖 Agent", border_style="green"),
+            console=console,
+            refresh_per_second=20,
+        ) as live:
+            def _on_content(delta: str) -> None:
+                buf.append(delta)
+                live.update(
+                    Panel(Markdown("".join(buf)), title="🤖 Agent", border_style="green")
+                )
+
+            reply = run_agent(user_input, messages, on_content=_on_content)
+            live.update(Panel(Markdown(reply), title="🤖 Agent", border_style="green"))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,35 @@
 """Shared config — loads Azure OpenAI creds from .env"""
 
+import atexit
 import os
+
+import httpx
 from dotenv import load_dotenv
-from openai import AzureOpenAI
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
-load_dotenv()
+# The openai and azure-identity imports are deferred into the client
+# builders below — they cost hundreds of ms and plenty of memory, and
+# CLI tools that import config transitively shouldn't pay that at startup.
+
+if not os.getenv("CONFIG_NO_DOTENV"):
+    load_dotenv()
+
+# HTTP/2 multiplexes concurrent requests over one TLS connection; it
+# needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# One pooled HTTP client for every chat() call in the process — keep-alive
+# skips the TCP+TLS handshake per request, and with HTTP/2 a parallel
+# swarm broadcast multiplexes all its POSTs over a single connection.
+_http_client = httpx.Client(
+    http2=HTTP2,
+    timeout=httpx.Timeout(60.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+atexit.register(_http_client.close)
 
 ENDPOINT = os.getenv("ENDPOINT_URL")
 API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
@@ -13,23 +37,83 @@ DEPLOYMENT = os.getenv("DEPLOYMENT_NAME", "gpt-4o")
 API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
 
 
-def get_client() -> AzureOpenAI:
-    """Create client using API key if set, otherwise falls back to Entra ID token auth."""
-    if API_KEY:
-        return AzureOpenAI(
-            azure_endpoint=ENDPOINT,
-            api_key=API_KEY,
-            api_version=API_VERSION,
+_client = None
+
+
+def get_client() -> "AzureOpenAI":
+    """Shared client using API key if set, otherwise falls back to Entra ID token auth."""
+    global _client
+    if _client is None:
+        from openai import AzureOpenAI
+
+        if API_KEY:
+            _client = AzureOpenAI(
+                azure_endpoint=ENDPOINT,
+                api_key=API_KEY,
+                api_version=API_VERSION,
+                http_client=_http_client,
+            )
+        else:
+            from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+
+            token_provider = get_bearer_token_provider(
+                DefaultAzureCredential(),
+                "https://cognitiveservices.azure.com/.default",
+            )
+            _client = AzureOpenAI(
+                azure_endpoint=ENDPOINT,
+                azure_ad_token_provider=token_provider,
+                api_version=API_VERSION,
+                http_client=_http_client,
+            )
+    return _client
+
+
+_async_client = None
+
+
+def get_async_client() -> "AsyncAzureOpenAI":
+    """Shared async client — created once so concurrent callers pool connections."""
+    global _async_client
+    if _async_client is None:
+        from openai import AsyncAzureOpenAI
+
+        if API_KEY:
+            _async_client = AsyncAzureOpenAI(
+                azure_endpoint=ENDPOINT,
+                api_key=API_KEY,
+                api_version=API_VERSION,
+            )
+        else:
+            from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+
+            token_provider = get_bearer_token_provider(
+                DefaultAzureCredential(),
+                "https://cognitiveservices.azure.com/.default",
+            )
+            _async_client = AsyncAzureOpenAI(
+                azure_endpoint=ENDPOINT,
+                azure_ad_token_provider=token_provider,
+                api_version=API_VERSION,
+            )
+    return _async_client
+
+
+async def achat(prompt: str, system: str = "You are a helpful AI assistant.", temperature: float = 0.7) -> str:
+    """Async twin of chat() — lets callers overlap several requests on one event loop."""
+    try:
+        client = get_async_client()
+        resp = await client.chat.completions.create(
+            model=DEPLOYMENT,
+            temperature=temperature,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
         )
-    token_provider = get_bearer_token_provider(
-        DefaultAzureCredential(),
-        "https://cognitiveservices.azure.com/.default",
-    )
-    return AzureOpenAI(
-        azure_endpoint=ENDPOINT,
-        azure_ad_token_provider=token_provider,
-        api_version=API_VERSION,
-    )
+        return resp.choices[0].message.content
+    except Exception as e:
+        return f"⚠️ AI request failed: {e}\nCheck your .env configuration (ENDPOINT_URL, AZURE_OPENAI_API_KEY, DEPLOYMENT_NAME)."
 
 
 def chat(prompt: str, system: str = "You are a helpful AI assistant.", temperature: float = 0.7) -> str:
@@ -3,20 +3,32 @@
 Emoji Translator Agent - Converts text statements into emoji sequences
 """
 
+import itertools
 import json
 import os
+import re
 import sys
+import types
 from typing import Optional
 
-# Try to import requests for API calls, but make it optional
+# requests is only needed for API mode and costs a multi-MB import, so
+# it's pulled in lazily by EmojiTranslator when an API key is present —
+# fallback-only users never pay for it
+
+# orjson decodes/encodes the API JSON bodies several times faster than
+# stdlib json; keep it optional like requests
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    import orjson
+    _json_dumps = orjson.dumps  # returns bytes — fine for request bodies
+    _json_loads = orjson.loads
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
-# Emoji mapping dictionary for fallback mode
-EMOJI_MAPPINGS = {
+# Emoji mapping dictionary for fallback mode — read-only so nothing can
+# mutate it behind the precompiled matcher below
+EMOJI_MAPPINGS = types.MappingProxyType({
     "hello": "👋",
     "hi": "👋",
     "goodbye": "👋",
@@ -81,7 +93,6 @@ EMOJI_MAPPINGS = {
     "medal": "🥇",
     "goal": "🎯",
     "heart": "❤️",
-    "star": "⭐",
     "sparkle": "✨",
     "magic": "✨",
     "skull": "💀",
@@ -125,7 +136,41 @@ EMOJI_MAPPINGS = {
     "lightning": "⚡",
     "thunder": "⛈️",
     "wind": "💨",
-}
+})
+
+# Hash-probe membership for callers that test keys directly
+_EMOJI_KEYS = frozenset(EMOJI_MAPPINGS)
+
+# Stable sentinel for the (common) no-match case
+_NO_MATCH = "🤔❓"
+
+# Single-pass matcher over the whole input: Aho-Corasick when the optional
+# pyahocorasick package is installed, otherwise one compiled alternation
+# (longest keys first so "sunny" wins over "sun"). Either way the scan is
+# linear in input length instead of every-key-times-every-word.
+# One C-level pass drops punctuation — no per-word strip() calls
+_PUNCT_TABLE = str.maketrans("", "", ".,!?;:-'\"")
+
+try:
+    import ahocorasick
+
+    _AC = ahocorasick.Automaton()
+    for _key, _emoji in EMOJI_MAPPINGS.items():
+        _AC.add_word(_key, _emoji)
+    _AC.make_automaton()
+
+    def _iter_emoji_matches(text):
+        for _end, emoji in _AC.iter(text):
+            yield emoji
+
+except ImportError:
+    _EMOJI_RE = re.compile(
+        "|".join(map(re.escape, sorted(EMOJI_MAPPINGS, key=len, reverse=True)))
+    )
+
+    def _iter_emoji_matches(text):
+        for match in _EMOJI_RE.finditer(text):
+            yield EMOJI_MAPPINGS[match.group()]
 
 
 class EmojiTranslator:
@@ -141,8 +186,33 @@ class EmojiTranslator:
         """
         self.use_api = use_api
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.api_available = self.use_api and self.api_key and REQUESTS_AVAILABLE
-        
+        # Only try (and pay for) the requests import when we could
+        # actually make API calls
+        self.requests_available = False
+        if self.use_api and self.api_key:
+            try:
+                import requests  # noqa: F401
+                self.requests_available = True
+            except ImportError:
+                pass
+        self.api_available = bool(self.use_api and self.api_key and self.requests_available)
+        # One Session for the translator's lifetime: keep-alive skips the
+        # TCP+TLS handshake on every call after the first, and the auth
+        # headers are set exactly once
+        self._session = None
+        if self.api_available:
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update({
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            })
+            self._session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8),
+            )
+
     def translate_with_api(self, text: str) -> str:
         """
         Translate text to emoji using OpenAI API.
@@ -154,11 +224,6 @@ class EmojiTranslator:
             Emoji string
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-            
             payload = {
                 "model": "gpt-3.5-turbo",
                 "messages": [
@@ -182,15 +247,14 @@ Rules:
                 "max_tokens": 100,
             }
             
-            response = requests.post(
+            response = self._session.post(
                 "https://api.openai.com/v1/chat/completions",
-                json=payload,
-                headers=headers,
+                data=_json_dumps(payload),
                 timeout=10
             )
-            
+
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 emoji_output = result["choices"][0]["message"]["content"].strip()
                 return emoji_output
             else:
@@ -211,30 +275,82 @@ Rules:
         Returns:
             Emoji string
         """
-        text_lower = text.lower()
-        emojis = []
-        
-        # Split text into words and find matching emojis
-        words = text_lower.split()
-        for word in words:
-            # Remove common punctuation
-            clean_word = word.strip(".,!?;:-'\"")
-            
-            # Direct match
-            if clean_word in EMOJI_MAPPINGS:
-                emojis.append(EMOJI_MAPPINGS[clean_word])
-            # Partial match
-            else:
-                for key, emoji in EMOJI_MAPPINGS.items():
-                    if key in clean_word or clean_word in key:
-                        emojis.append(emoji)
-                        break
-        
+        # Remove common punctuation
+        clean = text.lower().translate(_PUNCT_TABLE)
+
+        # One scan finds direct and partial matches alike; islice stops
+        # the matcher as soon as the 8-emoji cap is reached
+        emojis = list(itertools.islice(_iter_emoji_matches(clean), 8))
+
         # If no emojis found, return a generic response
         if not emojis:
-            return "🤔❓"
-        
-        return "".join(emojis[:8])  # Limit to 8 emojis
+            return _NO_MATCH
+
+        return "".join(emojis)
+
+    def translate_batch(self, texts: list) -> list:
+        """
+        Translate many texts in one API round-trip.
+
+        Sends all lines in a single JSON-mode chat completion and parses
+        the array back, so N inputs cost one HTTP call and one model-queue
+        slot instead of N. Falls back to per-text translation if the API
+        is unavailable or the response doesn't line up.
+
+        Args:
+            texts: The input texts to translate
+
+        Returns:
+            List of emoji strings, in the same order as texts
+        """
+        if not texts:
+            return []
+        if not self.api_available:
+            return [self.translate_with_fallback(t) for t in texts]
+
+        try:
+            payload = {
+                "model": "gpt-3.5-turbo",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": """You are an emoji translator. Convert each input line into a creative sequence of 3-8 emojis that represents its meaning.
+
+Rules:
+- Respond with a JSON object: {"translations": ["...", ...]}
+- One emoji string per input line, in the same order
+- Only emojis in each string, no text or punctuation""",
+                    },
+                    {
+                        "role": "user",
+                        "content": json.dumps({"lines": texts}),
+                    },
+                ],
+                "response_format": {"type": "json_object"},
+                "temperature": 0.7,
+                "max_tokens": 50 + 60 * len(texts),
+            }
+
+            response = self._session.post(
+                "https://api.openai.com/v1/chat/completions",
+                data=_json_dumps(payload),
+                timeout=30
+            )
+
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                content = result["choices"][0]["message"]["content"]
+                translations = _json_loads(content).get("translations")
+                if isinstance(translations, list) and len(translations) == len(texts):
+                    return [str(t).strip() for t in translations]
+                print("API Error: batch response didn't match input count")
+            else:
+                print(f"API Error: {response.status_code} - {response.text}")
+
+        except Exception as e:
+            print(f"Batch API call failed: {e}")
+
+        return [self.translate(t) for t in texts]
 
     def translate(self, text: str) -> str:
         """
@@ -267,10 +383,10 @@ def main():
     else:
         print("📱 Emoji Translator Agent (Fallback Mode)")
         print("-" * 40)
-        if not REQUESTS_AVAILABLE:
-            print("Note: requests library not available, using pattern matching mode")
-        else:
+        if not api_key:
             print("Note: No OpenAI API key found, using fallback pattern matching")
+        else:
+            print("Note: requests library not available, using pattern matching mode")
     
     print()
     
@@ -281,6 +397,12 @@ def main():
         result = translator.translate(text)
         print(f"Input:  {text}")
         print(f"Output: {result}")
+    elif not sys.stdin.isatty():
+        # Piped input - translate all lines in one batched call
+        texts = [line.strip() for line in sys.stdin if line.strip()]
+        for text, result in zip(texts, translator.translate_batch(texts)):
+            print(f"Input:  {text}")
+            print(f"Output: {result}")
     else:
         # Interactive mode
         print("Enter text to translate (or 'quit' to exit):")
@@ -0,0 +1,97 @@
+"""
+Persistent LLM response cache for the swarm's agents.
+
+Identical prompts during dev/testing re-hit the OpenAI/Azure/Ollama
+endpoints, wasting dollars and seconds. This module caches responses in
+a small SQLite database (WAL mode) keyed on a SHA-256 hash of the
+normalized request, with LRU eviction so the file stays bounded.
+
+Opt-in: set LLM_CACHE=1 in the environment. Production stays uncached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import unicodedata
+from typing import Any
+
+CACHE_PATH = os.environ.get(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".llm_cache.sqlite3"),
+)
+MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "2048"))
+
+_conn: sqlite3.Connection | None = None
+
+
+def enabled() -> bool:
+    """Whether caching is turned on (LLM_CACHE=1)."""
+    return os.environ.get("LLM_CACHE") == "1"
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def make_key(
+    model: str,
+    messages: list[dict],
+    temperature: float | None = None,
+    max_tokens: int | None = None,
+    tools: Any = None,
+) -> str:
+    """Build a deterministic cache key from the request parameters."""
+    norm_messages = []
+    for m in messages:
+        nm = dict(m)
+        nm["role"] = (m.get("role") or "").lower()
+        nm["content"] = unicodedata.normalize("NFC", m.get("content") or "")
+        norm_messages.append(nm)
+    payload = {
+        "model": (model or "").lower(),
+        "messages": norm_messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "tools": tools,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached value for key, or None on a miss."""
+    conn = _connect()
+    row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (time.time(), key))
+    conn.commit()
+    return row[0]
+
+
+def set(key: str, value: str) -> None:
+    """Store value under key, evicting the least-recently-used overflow."""
+    conn = _connect()
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, value, last_used) VALUES (?, ?, ?)",
+        (key, value, time.time()),
+    )
+    conn.execute(
+        "DELETE FROM cache WHERE key IN ("
+        "SELECT key FROM cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+        (MAX_ENTRIES,),
+    )
+    conn.commit()
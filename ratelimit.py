@@ -0,0 +1,80 @@
+"""
+Proactive token-bucket rate limiting for the OpenAI/Azure call sites.
+
+A Comedy Arena round fires three completions back to back; under bursty
+use that trips 429s and the SDK's exponential backoff — pure wasted
+wall-clock. Throttling up front against the account's RPM/TPM budget
+avoids the retries entirely.
+
+Configure via OPENAI_RPM (requests/minute) and OPENAI_TPM
+(tokens/minute). When neither is set, throttling is a no-op.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Rough prompt-token estimate (~4 chars/token plus per-message overhead)."""
+    return sum(len(m.get("content") or "") // 4 + 4 for m in messages)
+
+
+class TokenBucket:
+    """Classic token bucket: refills at rate/60 per second up to capacity."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = rate_per_minute
+        self.tokens = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Deduct amount and return the seconds to wait for it to be covered."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, amount: float = 1) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, amount: float = 1) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _bucket_from_env(var: str) -> TokenBucket | None:
+    value = os.environ.get(var)
+    return TokenBucket(float(value)) if value else None
+
+
+_request_bucket = _bucket_from_env("OPENAI_RPM")
+_token_bucket = _bucket_from_env("OPENAI_TPM")
+
+
+def throttle(messages: list[dict]) -> None:
+    """Block until the request fits the configured RPM/TPM budget."""
+    if _request_bucket is not None:
+        _request_bucket.acquire(1)
+    if _token_bucket is not None:
+        _token_bucket.acquire(estimate_tokens(messages))
+
+
+async def throttle_async(messages: list[dict]) -> None:
+    """Async variant of throttle for the asyncio call sites."""
+    if _request_bucket is not None:
+        await _request_bucket.acquire_async(1)
+    if _token_bucket is not None:
+        await _token_bucket.acquire_async(estimate_tokens(messages))
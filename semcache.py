@@ -0,0 +1,129 @@
+"""
+Semantic cache for repeat joke prompts.
+
+An exact-match cache misses when a user retypes the same topic slightly
+differently ("tell me about cats" vs "jokes about cats"). This layer
+embeds the prompt (all-MiniLM-L6-v2), searches for a stored prompt with
+cosine similarity >= 0.90, and returns the stored reply on a hit —
+skipping a multi-second generation call.
+
+Entries are namespaced per system prompt so the Knock Knock agent never
+returns a Dad joke. Pairs persist to disk as JSON.
+
+Dependencies (sentence-transformers, optionally faiss) are optional —
+without them every call is a no-op and agents fall through to the API.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMCACHE_AVAILABLE = True
+except ImportError:
+    SEMCACHE_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+SIM_THRESHOLD = float(os.environ.get("SEMCACHE_THRESHOLD", "0.90"))
+STORE_PATH = os.environ.get(
+    "SEMCACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".semcache.json"),
+)
+
+_lock = threading.Lock()
+_model = None
+_store: dict[str, list[dict]] | None = None  # namespace -> [{"embedding": [...], "reply": ...}]
+_indexes: dict[str, object] = {}  # namespace -> faiss index (when faiss is present)
+
+
+def available() -> bool:
+    """Whether the semantic cache can run at all."""
+    return SEMCACHE_AVAILABLE
+
+
+def namespace_for(system_prompt: str) -> str:
+    """Stable namespace id for a system prompt."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_model():
+    global _model
+    if _model is None:
+        _model = SentenceTransformer("all-MiniLM-L6-v2")
+    return _model
+
+
+def _load_store() -> dict[str, list[dict]]:
+    global _store
+    if _store is None:
+        try:
+            with open(STORE_PATH, "r", encoding="utf-8") as f:
+                _store = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _store = {}
+    return _store
+
+
+def _save_store() -> None:
+    with open(STORE_PATH, "w", encoding="utf-8") as f:
+        json.dump(_store, f, ensure_ascii=False)
+
+
+def _embed(text: str):
+    vec = _get_model().encode([text], normalize_embeddings=True)[0]
+    return np.asarray(vec, dtype=np.float32)
+
+
+def _faiss_index(namespace: str, entries: list[dict]):
+    index = _indexes.get(namespace)
+    if index is None or index.ntotal != len(entries):
+        dim = len(entries[0]["embedding"])
+        index = faiss.IndexFlatIP(dim)
+        index.add(np.array([e["embedding"] for e in entries], dtype=np.float32))
+        _indexes[namespace] = index
+    return index
+
+
+def lookup(namespace: str, prompt: str) -> str | None:
+    """Return a cached reply for a semantically similar prompt, or None."""
+    if not SEMCACHE_AVAILABLE:
+        return None
+    with _lock:
+        entries = _load_store().get(namespace, [])
+        if not entries:
+            return None
+        query = _embed(prompt)
+        if FAISS_AVAILABLE:
+            index = _faiss_index(namespace, entries)
+            sims, ids = index.search(query.reshape(1, -1), min(5, len(entries)))
+            best_sim, best_id = float(sims[0][0]), int(ids[0][0])
+        else:
+            matrix = np.array([e["embedding"] for e in entries], dtype=np.float32)
+            sims = matrix @ query
+            best_id = int(np.argmax(sims))
+            best_sim = float(sims[best_id])
+        if best_sim >= SIM_THRESHOLD:
+            return entries[best_id]["reply"]
+        return None
+
+
+def store(namespace: str, prompt: str, reply: str) -> None:
+    """Persist a (prompt embedding, reply) pair under the namespace."""
+    if not SEMCACHE_AVAILABLE:
+        return
+    with _lock:
+        store_data = _load_store()
+        entry = {"embedding": _embed(prompt).tolist(), "reply": reply}
+        store_data.setdefault(namespace, []).append(entry)
+        _indexes.pop(namespace, None)
+        _save_store()
@@ -17,14 +17,21 @@ Usage:
     python sharkbait/agent_sharkbait.py --initiation        # Join the Tank Gang
 """
 
+import atexit
+import itertools
+import json
 import os
+import re
 import sys
 import random
 import time
-import hashlib
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# hashlib (OpenSSL bindings) and mmap are only needed when files are
+# actually analyzed — reviews and patrols import them lazily so modes
+# like --initiation don't pay for them at startup
+
 # ============================================================
 # 🦈 SHARKBAIT LORE
 # ============================================================
@@ -43,7 +50,9 @@ SHARK_ASCII = r"""
 
 MINI_SHARK = "🦈"
 
-TANK_GANG = [
+# A tuple: immutable, built once as a code-object constant, and exactly
+# what random.choice wants
+TANK_GANG = (
     ("Gill", "the scarred leader", "This code has been through things. I respect it."),
     ("Bloat", "the pufferfish", "This file is... inflating... I'M ABOUT TO BLOW!"),
     ("Peach", "the starfish", "I've been stuck to this codebase for 3 hours. Here's what I see."),
@@ -52,13 +61,13 @@ TANK_GANG = [
     ("Deb (& Flo)", "the split personality", "I love this code! / No you don't! / Yes I do!"),
     ("Bubbles", "the bubble obsessed", "BUBBLES! ...sorry, I mean, nice O(n) complexity."),
     ("Nemo", "the brave one", "Just keep pushing, just keep pushing..."),
-]
+)
 
 # ============================================================
 # 🦈 REVIEW TEMPLATES
 # ============================================================
 
-OPENING_LINES = [
+OPENING_LINES = (
     "The shark circles your code... sensing weakness...",
     "A dorsal fin emerges from the depths of your repo...",
     "Agent Sharkbait has detected prey — er, code — in the water...",
@@ -67,9 +76,9 @@ OPENING_LINES = [
     "Shark bait, ooh ha ha! Let me take a bite of this file...",
     "The Tank Gang has assembled to review your contribution.",
     "From the deep abyss of the git log, a review surfaces...",
-]
+)
 
-CODE_COMPLIMENTS = [
+CODE_COMPLIMENTS = (
     "Clean as coral reef water on a calm day 🐠",
     "This function flows like a gentle current. Smooth.",
     "I tried to find a bug but it swam away too fast.",
@@ -78,9 +87,9 @@ CODE_COMPLIMENTS = [
     "Gill would nod approvingly. That's the highest honor.",
     "Jacques wouldn't even need to clean this. Immaculate.",
     "The Tank Gang unanimously approves. That NEVER happens.",
-]
+)
 
-CODE_ROASTS = [
+CODE_ROASTS = (
     "This code looks like it was written during a feeding frenzy.",
     "I've seen cleaner things in the bottom of a fish tank.",
     "Bloat just looked at this file and inflated to maximum capacity.",
@@ -93,9 +102,9 @@ CODE_ROASTS = [
     "Somewhere, a senior developer just felt a disturbance in the force.",
     "The sharks aren't circling because they're interested. They're confused.",
     "P. Sherman, 42 Wallaby Way — that's where I'd recommend filing this code.",
-]
+)
 
-MEDIUM_TAKES = [
+MEDIUM_TAKES = (
     "Acceptable. The sharks will let this pass... for now.",
     "It's not elegant, but it won't sink the ship. Probably.",
     "Peach has seen worse. Peach has seen better. Peach has seen... everything.",
@@ -103,9 +112,9 @@ MEDIUM_TAKES = [
     "The code works, but it works the way a fish walks. Technically possible.",
     "60% of the time, this works every time.",
     "It compiles. In the ocean, that's called 'not drowning.' Congrats.",
-]
+)
 
-NAUTICAL_WISDOM = [
+NAUTICAL_WISDOM = (
     "Fish are friends, not food. But your bugs? Those are PREY.",
     "Just keep swimming, just keep swimming — through the merge conflicts.",
     "The ocean doesn't care about your linter settings. Neither does this repo.",
@@ -116,16 +125,19 @@ NAUTICAL_WISDOM = [
     "What do we do? We swim, swim, push, push, merge, merge.",
     "The sea is dark and full of technical debt.",
     "You can't spell 'sharkbait' without 'AI'. Well, you can. But don't.",
-]
+)
 
-SHARKBAIT_SCALE = [
+SHARKBAIT_SCALE = (
     ("🦈🦈🦈🦈🦈", "APEX PREDATOR", "Top of the food chain. This code HUNTS."),
     ("🦈🦈🦈🦈🐟", "GREAT WHITE", "Fearsome. Respected. Occasionally misunderstood."),
     ("🦈🦈🦈🐟🐟", "REEF SHARK", "Solid. Reliable. Won't win awards but won't eat you either."),
     ("🦈🦈🐟🐟🐟", "NURSE SHARK", "Passive. Mostly harmless. Sleeps on the ocean floor."),
     ("🦈🐟🐟🐟🐟", "GUPPY", "Small. Fragile. Might get eaten by the first code review."),
     ("🐟🐟🐟🐟🐟", "PLANKTON", "At the bottom of the food chain. But hey, even plankton are essential."),
-]
+)
+
+# Just the emoji column, for patrol rows that don't need name or blurb
+SCALE_EMOJIS = tuple(s[0] for s in SHARKBAIT_SCALE)
 
 FILE_REACTIONS = {
     ".py": "Ah, Python. The clownfish of programming languages. Colorful, popular, swims well.",
@@ -144,63 +156,281 @@ FILE_REACTIONS = {
 }
 
 
+# One private RNG for all shark decisions: no module-singleton
+# indirection, and seedable (SHARKBAIT_SEED or --seed) for reproducible
+# reviews without touching anyone else's random state
+_RNG = random.Random(int(os.getenv("SHARKBAIT_SEED", 0)) or None)
+
+# Pipes, CI logs, and NO_COLOR users get plain instant text: no ANSI
+# noise in captured output, and no sleeping where nobody can see the
+# drama anyway
+_IS_TTY = (
+    sys.stdout.isatty()
+    and not os.environ.get("NO_COLOR")
+    and not os.environ.get("CI")
+)
+
+# Prefixes prebuilt once — color() runs for every line of every review,
+# so each call is just a dict lookup and two concatenations
+_RESET = "\033[0m"
+_ANSI_PREFIX = {
+    c: f"\033[{code}m"
+    for c, code in {
+        "r": "91", "g": "92", "y": "93", "b": "94",
+        "m": "95", "c": "96", "w": "97", "bold": "1",
+    }.items()
+}
+
+
 def color(text, c):
     """ANSI color wrapper."""
-    codes = {"r": "91", "g": "92", "y": "93", "b": "94", "m": "95", "c": "96", "w": "97", "bold": "1"}
-    return f"\033[{codes.get(c, '0')}m{text}\033[0m"
+    if not _IS_TTY:
+        return text
+    return _ANSI_PREFIX.get(c, _RESET) + text + _RESET
+
+
+# Extensions are a small closed set, so the full "Type:" line for each
+# is formatted and colored exactly once at import
+_TYPE_LINES = {ext: color(f"  🔬 Type: {r}", "m") for ext, r in FILE_REACTIONS.items()}
+_TYPE_LINE_DEFAULT = color("  🔬 Type: Unknown species. The sharks are intrigued.", "m")
+
+# Static rules and banners wrapped once at import instead of per review
+_RULE60_C = color("=" * 60, "c")
+_RULE60_NL_C = color("\n" + "=" * 60, "c")
+_RULE40_C = color(f"  {'─' * 40}", "c")
+_RULE40_NL_C = color(f"\n  {'─' * 40}", "c")
+_RULE50_NL_M = color(f"\n  {'═' * 50}", "m")
+_RULE50_TAIL_M = color(f"  {'═' * 50}\n", "m")
 
 
 def slow_print(text, delay=0.02):
     """Dramatic text reveal."""
-    for char in text:
-        sys.stdout.write(char)
+    if not text or not _IS_TTY:
+        print(text)
+        return
+    # Reveal in at most 40 frames: one write+flush per chunk instead of
+    # per character keeps the effect above 30Hz while cutting syscalls
+    # by an order of magnitude on long lines
+    step = -(-len(text) // min(len(text), 40))  # ceil division
+    frame_delay = delay * step
+    for i in range(0, len(text), step):
+        sys.stdout.write(text[i:i + step])
         sys.stdout.flush()
-        time.sleep(delay)
+        time.sleep(frame_delay)
     print()
 
 
-def shark_fin_animation():
-    """A shark fin crosses the terminal."""
+_FIN_FRAMES = None
+
+
+def _build_fin_frames():
     width = 50
     fin = "   /\\ "
     body = "~^^~^^~"
-    for i in range(0, width, 3):
-        frame = " " * i + fin + "\n" + "~" * i + body + "~" * (width - i)
-        sys.stdout.write(f"\r{color(frame, 'c')}")
+    return tuple(
+        "\r" + color(" " * i + fin + "\n" + "~" * i + body + "~" * (width - i), "c")
+        for i in range(0, width, 3)
+    )
+
+
+def shark_fin_animation():
+    """A shark fin crosses the terminal."""
+    global _FIN_FRAMES
+    if not _IS_TTY:
+        return
+    # Frames are rendered once (lazily) so the sleep loop is nothing but
+    # ready-made writes — no string building or color() work per frame
+    if _FIN_FRAMES is None:
+        _FIN_FRAMES = _build_fin_frames()
+    for frame in _FIN_FRAMES:
+        sys.stdout.write(frame)
         sys.stdout.flush()
         time.sleep(0.1)
         sys.stdout.write("\033[F")  # Move cursor up
     print("\n")
 
 
+# Full analyze_file results cached by (mtime, size) and persisted to a
+# JSON sidecar, so warm patrols skip the read and the hash entirely —
+# one stat() per unchanged file instead of reading every byte
+_STATS_CACHE_PATH = os.path.join(
+    os.path.expanduser(os.environ.get("XDG_CACHE_HOME", "~/.cache")),
+    "sharkbait",
+    "stats.json",
+)
+_stats_cache = None
+_stats_cache_dirty = False
+
+
+def _load_stats_cache():
+    global _stats_cache
+    if _stats_cache is None:
+        try:
+            with open(_STATS_CACHE_PATH) as fh:
+                _stats_cache = json.load(fh)
+        except (OSError, ValueError):
+            _stats_cache = {}
+    return _stats_cache
+
+
+def _save_stats_cache():
+    if not _stats_cache_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(_STATS_CACHE_PATH), exist_ok=True)
+        tmp = _STATS_CACHE_PATH + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump(_stats_cache, fh)
+        os.replace(tmp, _STATS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+atexit.register(_save_stats_cache)
+
+
+def _remember_stats(filepath, st, stats):
+    """Record one analysis in the cache (and mark it for the atexit flush)."""
+    global _stats_cache_dirty
+    _load_stats_cache()[os.path.abspath(filepath)] = {
+        "mtime": st.st_mtime_ns,
+        "size": st.st_size,
+        "stats": stats,
+    }
+    _stats_cache_dirty = True
+
+
+# Waters the shark never enters — dependency dirs, build output, VCS guts
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build"})
+
+# What counts as reviewable prey
+_PATROL_EXTENSIONS = frozenset({
+    ".py", ".js", ".ts", ".md", ".yml", ".yaml", ".json", ".html", ".css", ".sh", ".txt",
+})
+_QUICK_BITE_EXTENSIONS = frozenset({".py", ".md", ".yml", ".js", ".ts"})
+
+
+def _walk(root, extensions):
+    """Lazily yield matching file paths under root, skipping _SKIP_DIRS.
+
+    os.scandir keeps the is_dir() answer from the directory listing, so
+    this walk never pays the extra stat-per-path that glob('**/*') does,
+    and being a generator it never materializes the whole reef at once.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Hidden dirs stay hidden (glob never matched them either)
+                if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                    yield from _walk(entry.path, extensions)
+            elif os.path.splitext(entry.name)[1].lower() in extensions:
+                yield entry.path
+
+
+# Sharks don't chew on rocks: known-binary extensions skip the open()
+# entirely, and anything else gets a 4KB NUL sniff (git's heuristic)
+# before we commit to reading the whole thing as text
+_BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".bmp",
+    ".pdf", ".zip", ".tar", ".gz", ".bz2", ".xz", ".7z",
+    ".pyc", ".pyo", ".so", ".dylib", ".dll", ".exe", ".bin",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".mp3", ".mp4", ".wav", ".ogg", ".avi", ".mov",
+    ".db", ".sqlite", ".sqlite3", ".pickle", ".pkl",
+})
+
+
+def _is_text(path):
+    """Fast binary check: a NUL byte in the first 4KB means 'not prey'."""
+    if os.path.splitext(path)[1].lower() in _BINARY_EXTENSIONS:
+        return False
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096)
+    except OSError:
+        return False
+    return b"\0" not in head
+
+
+# Compiled once: C-level scans over the whole buffer beat per-line
+# Python-level strip/startswith/in checks for these flags
+_COMMENT_RE = re.compile(r"(?m)^[ \t]*(?:#|//)")
+_TODO_RE = re.compile(r"TODO|FIXME|HACK")
+
+
 def analyze_file(filepath):
     """Analyze a file and generate review metrics."""
+    import hashlib
+    import mmap
+
+    if not _is_text(filepath):
+        return None
     try:
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
-    except (FileNotFoundError, IsADirectoryError):
+        st = os.stat(filepath)
+    except OSError:
         return None
 
-    lines = content.split("\n")
+    cache = _load_stats_cache()
+    key = os.path.abspath(filepath)
+    entry = cache.get(key)
+    if entry and entry.get("mtime") == st.st_mtime_ns and entry.get("size") == st.st_size:
+        return dict(entry["stats"])
+
+    try:
+        if st.st_size > (1 << 20):
+            # Big files (bundled JS and friends): hash straight out of
+            # the page cache via mmap — zero-copy into blake2b — instead
+            # of holding a second full copy of the bytes in RAM
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest = hashlib.blake2b(mm, digest_size=4).hexdigest().upper()
+                content = bytes(mm).decode("utf-8", errors="replace")
+        else:
+            with open(filepath, "rb") as f:
+                raw = f.read()
+            digest = hashlib.blake2b(raw, digest_size=4).hexdigest().upper()
+            content = raw.decode("utf-8", errors="replace")
+    except (OSError, ValueError):
+        return None
+
+    # One pass for the line metrics; the boolean flags come from
+    # compiled regex scans that short-circuit at the first hit in C
+    line_count = empty = longest = 0
+    for line in content.split("\n"):
+        line_count += 1
+        n = len(line)
+        if n > longest:
+            longest = n
+        if not line.strip():
+            empty += 1
+
     stats = {
-        "lines": len(lines),
+        "lines": line_count,
         "chars": len(content),
-        "empty_lines": sum(1 for l in lines if l.strip() == ""),
-        "longest_line": max((len(l) for l in lines), default=0),
-        "has_comments": any(l.strip().startswith("#") or l.strip().startswith("//") for l in lines),
-        "has_todos": any("TODO" in l or "FIXME" in l or "HACK" in l for l in lines),
-        "has_emoji": any(ord(c) > 127 for c in content),
-        "extension": Path(filepath).suffix.lower(),
-        "filename": Path(filepath).name,
-        "hash": hashlib.sha256(content.encode()).hexdigest()[:8].upper(),
+        "empty_lines": empty,
+        "longest_line": longest,
+        "has_comments": _COMMENT_RE.search(content) is not None,
+        "has_todos": _TODO_RE.search(content) is not None,
+        # str.isascii() is an O(1) flag check in CPython — no scan at all
+        "has_emoji": not content.isascii(),
+        # os.path's C-implemented split beats building a Path object
+        # just to read two attributes off it
+        "extension": os.path.splitext(filepath)[1].lower(),
+        "filename": os.path.basename(filepath),
+        # blake2b at digest_size=4 gives the same 8 hex chars for a lot
+        # less compute than truncated SHA-256, and hashing the raw bytes
+        # skips a decode+re-encode round-trip
+        "hash": digest,
     }
 
-    # Generate a deterministic-ish but fun score
-    seed = int(stats["hash"], 16)
-    random.seed(seed)
-    stats["score"] = random.randint(0, 5)
-    random.seed()  # Re-randomize
+    # Generate a deterministic-ish but fun score — a throwaway Random
+    # keyed on the file DNA, so _RNG's stream stays untouched
+    stats["score"] = random.Random(int(stats["hash"], 16)).randint(0, 5)
 
+    _remember_stats(filepath, st, stats)
     return stats
 
 
@@ -212,60 +442,62 @@ def review_file(filepath, roast_mode=False):
         return
 
     # Who's reviewing?
-    reviewer_name, reviewer_title, reviewer_quote = random.choice(TANK_GANG)
+    reviewer_name, reviewer_title, reviewer_quote = _RNG.choice(TANK_GANG)
     scale_emoji, scale_name, scale_desc = SHARKBAIT_SCALE[min(5, max(0, 5 - stats["score"]))]
 
-    # File type reaction
-    ext_reaction = FILE_REACTIONS.get(stats["extension"], "Unknown species. The sharks are intrigued.")
-
     print()
-    print(color("=" * 60, "c"))
+    print(_RULE60_C)
     slow_print(color(f"  🦈 AGENT SHARKBAIT — FILE REVIEW 🦈", "c"), delay=0.03)
-    print(color("=" * 60, "c"))
+    print(_RULE60_C)
 
     # Opening
-    slow_print(color(f"\n  {random.choice(OPENING_LINES)}\n", "y"), delay=0.02)
+    slow_print(color(f"\n  {_RNG.choice(OPENING_LINES)}\n", "y"), delay=0.02)
+
+    # Everything after the dramatic opener goes out in one buffered
+    # write instead of ~20 line-flushed prints
+    out = []
 
     # File info
-    print(color(f"  📄 File: {stats['filename']}", "w"))
-    print(color(f"  🔬 Type: {ext_reaction}", "m"))
-    print(color(f"  📊 Lines: {stats['lines']} | Chars: {stats['chars']} | Empty: {stats['empty_lines']}", "w"))
-    print(color(f"  🧬 File DNA: #{stats['hash']}", "b"))
+    out.append(color(f"  📄 File: {stats['filename']}", "w"))
+    out.append(_TYPE_LINES.get(stats["extension"], _TYPE_LINE_DEFAULT))
+    out.append(color(f"  📊 Lines: {stats['lines']} | Chars: {stats['chars']} | Empty: {stats['empty_lines']}", "w"))
+    out.append(color(f"  🧬 File DNA: #{stats['hash']}", "b"))
     if stats["longest_line"] > 120:
-        print(color(f"  ⚠️  Longest line: {stats['longest_line']} chars. That line is longer than a blue whale.", "r"))
+        out.append(color(f"  ⚠️  Longest line: {stats['longest_line']} chars. That line is longer than a blue whale.", "r"))
     if stats["has_todos"]:
-        print(color(f"  📌 TODOs/FIXMEs detected. The sharks can smell procrastination.", "y"))
+        out.append(color(f"  📌 TODOs/FIXMEs detected. The sharks can smell procrastination.", "y"))
     if stats["has_emoji"]:
-        print(color(f"  ✨ Contains emoji. The reef approves of self-expression.", "g"))
+        out.append(color(f"  ✨ Contains emoji. The reef approves of self-expression.", "g"))
 
     # Rating
-    print(color(f"\n  {'─' * 40}", "c"))
-    print(color(f"  SHARKBAIT SCALE™: {scale_emoji}", "c"))
-    print(color(f"  Rating: {scale_name}", "bold"))
-    print(color(f"  {scale_desc}", "w"))
-    print(color(f"  {'─' * 40}", "c"))
+    out.append(_RULE40_NL_C)
+    out.append(color(f"  SHARKBAIT SCALE™: {scale_emoji}", "c"))
+    out.append(color(f"  Rating: {scale_name}", "bold"))
+    out.append(color(f"  {scale_desc}", "w"))
+    out.append(_RULE40_C)
 
     # Reviewer commentary
-    print(color(f"\n  🐠 Reviewed by: {reviewer_name} ({reviewer_title})", "g"))
-    print(color(f"  💬 \"{reviewer_quote}\"", "g"))
+    out.append(color(f"\n  🐠 Reviewed by: {reviewer_name} ({reviewer_title})", "g"))
+    out.append(color(f"  💬 \"{reviewer_quote}\"", "g"))
 
     # The actual review
-    print(color(f"\n  📝 REVIEW:", "y"))
+    out.append(color(f"\n  📝 REVIEW:", "y"))
     if roast_mode:
-        print(color(f"  🔥 {random.choice(CODE_ROASTS)}", "r"))
-        print(color(f"  🔥 {random.choice(CODE_ROASTS)}", "r"))
+        out.append(color(f"  🔥 {_RNG.choice(CODE_ROASTS)}", "r"))
+        out.append(color(f"  🔥 {_RNG.choice(CODE_ROASTS)}", "r"))
     elif stats["score"] >= 4:
-        print(color(f"  ✅ {random.choice(CODE_COMPLIMENTS)}", "g"))
+        out.append(color(f"  ✅ {_RNG.choice(CODE_COMPLIMENTS)}", "g"))
     elif stats["score"] >= 2:
-        print(color(f"  🔶 {random.choice(MEDIUM_TAKES)}", "y"))
+        out.append(color(f"  🔶 {_RNG.choice(MEDIUM_TAKES)}", "y"))
     else:
-        print(color(f"  🔥 {random.choice(CODE_ROASTS)}", "r"))
+        out.append(color(f"  🔥 {_RNG.choice(CODE_ROASTS)}", "r"))
 
     # Nautical wisdom
-    print(color(f"\n  🌊 Nautical Wisdom: {random.choice(NAUTICAL_WISDOM)}", "c"))
+    out.append(color(f"\n  🌊 Nautical Wisdom: {_RNG.choice(NAUTICAL_WISDOM)}", "c"))
 
-    print(color("\n" + "=" * 60, "c"))
-    print()
+    out.append(_RULE60_NL_C)
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def patrol_repo():
@@ -274,32 +506,41 @@ def patrol_repo():
     slow_print(color("  🦈 SHARKBAIT PATROL MODE — Scanning the entire reef...\n", "y"), delay=0.03)
 
     repo_root = Path(__file__).parent.parent
-    files = []
-    for ext in ["*.py", "*.js", "*.ts", "*.md", "*.yml", "*.yaml", "*.json", "*.html", "*.css", "*.sh", "*.txt"]:
-        files.extend(glob.glob(str(repo_root / "**" / ext), recursive=True))
-
-    # Filter out .git
-    files = [f for f in files if ".git" + os.sep not in f and "__pycache__" not in f]
-
-    if not files:
-        print(color("  🦈 No files found. The ocean is empty. Eerie.", "r"))
-        return
-
-    print(color(f"  🦈 {len(files)} files detected in the reef.\n", "c"))
-
+    # Two lazy views of the same scandir walk: one feeds the pool, the
+    # other pairs each result with its path — no full file list in memory
+    paths, jobs = itertools.tee(_walk(str(repo_root), _PATROL_EXTENSIONS))
+    _load_stats_cache()  # load once up front so worker threads never race the lazy init
+
+    # Per-file analysis is independent and I/O-dominated (the GIL is
+    # released inside read() and hashlib), so threads give near-linear
+    # speedup without process spawn/pickle overhead — and workers share
+    # the stats cache in-process, so the atexit flush just works.
+    # Results stream back in file order so the report prints as they
+    # arrive; printing stays out here to keep stdout uninterleaved.
     scores = []
-    for filepath in files:
-        stats = analyze_file(filepath)
-        if stats:
-            scale_emoji = SHARKBAIT_SCALE[min(5, max(0, 5 - stats["score"]))][0]
+    report = []  # flushed every 64 lines — one syscall per chunk, not per file
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+        for filepath, stats in zip(paths, pool.map(analyze_file, jobs)):
+            if not stats:
+                continue
+            scale_emoji = SCALE_EMOJIS[min(5, max(0, 5 - stats["score"]))]
             name = os.path.relpath(filepath, repo_root)
             scores.append((name, stats["score"], scale_emoji))
-            reviewer = random.choice(TANK_GANG)
-            print(f"  {scale_emoji}  {color(name, 'w')} — {color(reviewer[2], 'c')}")
+            reviewer = _RNG.choice(TANK_GANG)
+            report.append(f"  {scale_emoji}  {color(name, 'w')} — {color(reviewer[2], 'c')}\n")
+            if len(report) >= 64:
+                sys.stdout.write("".join(report))
+                report.clear()
+    if report:
+        sys.stdout.write("".join(report))
+
+    if not scores:
+        print(color("  🦈 No files found. The ocean is empty. Eerie.", "r"))
+        return
 
     # Summary
-    avg = sum(s[1] for s in scores) / len(scores) if scores else 0
-    print(color(f"\n  {'═' * 50}", "m"))
+    avg = sum(s[1] for s in scores) / len(scores)
+    print(_RULE50_NL_M)
     print(color(f"  🦈 PATROL COMPLETE", "m"))
     print(color(f"  📊 Files scanned: {len(scores)}", "w"))
     print(color(f"  📈 Average Sharkbait Score: {avg:.1f}/5", "y"))
@@ -311,7 +552,7 @@ def patrol_repo():
     else:
         print(color(f"  💀 Verdict: SHARK-INFESTED CODE. Swim at your own risk.", "r"))
 
-    print(color(f"  {'═' * 50}\n", "m"))
+    print(_RULE50_TAIL_M)
 
 
 def initiation():
@@ -320,7 +561,8 @@ def initiation():
     print()
     slow_print(color("  🦈 THE TANK GANG INITIATION CEREMONY 🦈", "m"), delay=0.04)
     print()
-    time.sleep(0.5)
+    if _IS_TTY:
+        time.sleep(0.5)
 
     lines = [
         ("Gill", "State your name."),
@@ -343,7 +585,8 @@ def initiation():
             print(color(f"  {speaker}: ", "y") + color(f"\"{line}\"", "w"))
         else:
             print(color(f"  {line}", "w"))
-        time.sleep(0.6)
+        if _IS_TTY:
+            time.sleep(0.6)
 
     print()
     print(color("  ═══════════════════════════════════════", "c"))
@@ -357,15 +600,22 @@ def main():
     """Agent Sharkbait main entry point."""
     args = sys.argv[1:]
 
+    # --seed N: reproducible reviews (same sharks, same roasts)
+    if "--seed" in args:
+        i = args.index("--seed")
+        try:
+            _RNG.seed(int(args[i + 1]))
+        except (IndexError, ValueError):
+            print(color("  🦈 --seed needs a number. The sharks are confused.", "r"))
+            return
+        del args[i:i + 2]
+
     if not args:
         # Review a random file from the repo
         repo_root = Path(__file__).parent.parent
-        files = []
-        for ext in ["*.py", "*.md", "*.yml", "*.js", "*.ts"]:
-            files.extend(glob.glob(str(repo_root / "**" / ext), recursive=True))
-        files = [f for f in files if ".git" + os.sep not in f and "__pycache__" not in f]
+        files = list(_walk(str(repo_root), _QUICK_BITE_EXTENSIONS))
         if files:
-            target = random.choice(files)
+            target = _RNG.choice(files)
             review_file(target)
         else:
             print(color("  🦈 No files in the reef to review. Push some code!", "r"))
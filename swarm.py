@@ -0,0 +1,823 @@
+"""
+🐝 Agent Swarm — an in-process message bus for the hackathon agents.
+
+Implements the "Shared Knowledge Bus" slice of
+docs/research/AGENT_SWARM_ARCHITECTURE.md: agents register capabilities,
+messages get routed (directly, via the router, or broadcast to every
+agent that can handle the task type), and the full conversation history
+stays queryable.
+
+Handlers call the shared Azure OpenAI helper in config.chat, so each
+send is one LLM round-trip. Broadcast fans out over a thread pool —
+the calls are network-bound, so N agents answer in ~1× latency instead
+of N×.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import itertools
+import json
+import operator
+import re
+import secrets
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Iterator
+
+# config.chat rides one pooled, keep-alive HTTP client for the whole
+# process, so the thread-pool broadcast below doesn't pay a TCP+TLS
+# handshake per agent
+from config import chat
+
+# orjson renders the handler context dicts several times faster than
+# stdlib json; fall back quietly when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+BATCH_SIZE = 8  # flush a batchable agent's queue at this depth...
+BATCH_WINDOW = 0.05  # ...or after this many seconds, whichever comes first
+
+RESPONSE_CACHE_MAX = 1024  # (agent, content-digest) pairs kept
+RESPONSE_TTL = 300.0  # seconds before a cached response goes stale
+
+_BATCH_SPLIT_RE = re.compile(r"(?mi)^response\s+\d+\s*:\s*")
+_ROUTER_RE = re.compile(
+    r"^(agent|confidence|reasoning)\s*:\s*(.+)$", re.MULTILINE | re.IGNORECASE
+)
+
+# Message ids: random per-process prefix + counter. Much cheaper than
+# formatting (and truncating) a uuid4 per message, still unique across
+# processes.
+_id_prefix = secrets.token_hex(2)
+_id_counter = itertools.count()
+
+
+def _next_id() -> str:
+    return f"{_id_prefix}{next(_id_counter):06x}"
+
+
+def _isoformat(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1e9, timezone.utc).isoformat()
+
+
+class TaskType(str, Enum):
+    """Known task categories (mirrors the agent registry in agents/router.py)."""
+
+    GENERAL = "general"
+    SQL = "sql"
+    CODE_REVIEW = "code_review"
+    README = "readme"
+    GIT = "git"
+    VIZ = "viz"
+    ROUTING = "routing"
+    ORCHESTRATION = "orchestration"
+
+
+def _as_task_type(value: str) -> str:
+    """Map known task-type strings onto interned TaskType members.
+
+    Members compare by identity and their value strings exist exactly
+    once, so messages stop carrying their own copies. Unknown strings
+    (custom agents) pass through untouched — str-mixin enums hash and
+    compare interchangeably with plain strings.
+    """
+    try:
+        return TaskType(value)
+    except ValueError:
+        return value
+
+
+@dataclass(slots=True)
+class Message:
+    """A single message on the bus."""
+
+    from_agent: str
+    content: str
+    task_type: str = TaskType.GENERAL
+    context: dict = field(default_factory=dict)
+    priority: int = 5
+    reply_to: str | None = None
+    id: str = field(default_factory=_next_id)
+    # Stored as nanoseconds; most messages never hit to_dict(), so defer
+    # the isoformat() string build until then
+    timestamp: int = field(default_factory=time.time_ns)
+    status: str = "pending"
+
+    # to_dict runs in tight loops (get_history, the JSONL log); one
+    # shared attrgetter pulls the plain fields in a single C call
+    _FIELDS = ("id", "from_agent", "content", "context", "priority", "reply_to")
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    def to_dict(self) -> dict:
+        d = dict(zip(self._FIELDS, self._GETTER(self)))
+        d["task_type"] = getattr(self.task_type, "value", self.task_type)
+        d["timestamp"] = _isoformat(self.timestamp)
+        d["status"] = self.status
+        return d
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Message":
+        msg = cls(
+            from_agent=data.get("from_agent", "unknown"),
+            content=data.get("content", ""),
+            task_type=_as_task_type(data.get("task_type", "general")),
+            context=data.get("context", {}),
+            priority=data.get("priority", 5),
+            reply_to=data.get("reply_to"),
+        )
+        if "id" in data:
+            msg.id = data["id"]
+        if "timestamp" in data:
+            value = data["timestamp"]
+            if isinstance(value, str):  # older dumps stored ISO strings
+                value = int(datetime.fromisoformat(value).timestamp() * 1e9)
+            msg.timestamp = value
+        if "status" in data:
+            msg.status = data["status"]
+        return msg
+
+
+@dataclass(slots=True)
+class Response:
+    """An agent's answer to a Message."""
+
+    message_id: str
+    agent: str
+    content: str
+    success: bool = True
+    timestamp: int = field(default_factory=time.time_ns)
+
+    def to_dict(self) -> dict:
+        return {
+            "message_id": self.message_id,
+            "agent": self.agent,
+            "content": self.content,
+            "success": self.success,
+            "timestamp": _isoformat(self.timestamp),
+        }
+
+
+@dataclass(slots=True)
+class AgentCapability:
+    """What an agent can do and how to invoke it."""
+
+    name: str
+    description: str
+    task_types: frozenset[str]
+    handler: Callable[[Message], str]
+    # Batchable agents coalesce bursts of messages into one LLM call;
+    # keep False for latency-critical agents like the router
+    batchable: bool = False
+    # Rendered once at register time for display paths like the REPL
+    _task_types_str: str = ""
+
+    def can_handle(self, task_type: str) -> bool:
+        return task_type in self.task_types or TaskType.GENERAL in self.task_types
+
+
+class Swarm:
+    """The message bus: agent registry + send/broadcast + history."""
+
+    def __init__(self, history_cap: int = 10000, log_path: str | None = None):
+        self._agents: dict[str, AgentCapability] = {}
+        # Optional durability: append each message as one JSON line.
+        # O(1) per message, unlike rewriting the whole history as a blob,
+        # and each message is durable as soon as the line is flushed.
+        self._log_fh = open(log_path, "a", buffering=1) if log_path else None
+        # Bounded history: a long-running swarm would otherwise grow RSS
+        # forever; deque(maxlen) keeps appends O(1) and memory flat
+        self._message_history: deque[Message] = deque(maxlen=history_cap)
+        self._response_history: deque[Response] = deque(maxlen=history_cap)
+        # Reply indices so get_conversation is O(replies), not two full
+        # history scans per call
+        self._by_id: dict[str, Message] = {}
+        self._replies: dict[str, list[Message]] = {}
+        # Inverted index so find_agents_for_task is a dict hit instead of
+        # a can_handle() scan over every agent
+        self._by_task: dict[str, set[str]] = defaultdict(set)
+        self._wildcard_agents: set[str] = set()
+        # Rendered agent list for the router prompt; rebuilt only when
+        # the registry changes, not on every routed request
+        self._agents_info_cache: str | None = None
+        # Router classifications keyed by content digest — repeated
+        # queries skip the routing LLM round-trip entirely
+        self._route_cache: dict[bytes, str] = {}
+        # Short-TTL (agent, content-digest) -> Response cache: broadcasts
+        # and retried REPL queries re-ask agents the same thing, and each
+        # unique answer only needs computing once
+        self._response_cache: dict[tuple[str, str], tuple[float, Response]] = {}
+        # send() is called from the broadcast thread pool — guard shared state
+        self._lock = threading.Lock()
+        # Micro-batching: bursts of messages for the same batchable agent
+        # share a single LLM round-trip
+        self._batch_queues: dict[str, list[tuple[Message, Future]]] = defaultdict(list)
+        self._batch_timers: dict[str, threading.Timer] = {}
+        self._register_builtin_agents()
+
+    # -- registry -----------------------------------------------------------
+
+    def register(self, agent: AgentCapability) -> None:
+        agent.task_types = frozenset(_as_task_type(t) for t in agent.task_types)
+        agent._task_types_str = ", ".join(sorted(agent.task_types))
+        self._agents[agent.name] = agent
+        for task_type in agent.task_types:
+            self._by_task[task_type].add(agent.name)
+        # general in task_types means the agent handles anything
+        if TaskType.GENERAL in agent.task_types:
+            self._wildcard_agents.add(agent.name)
+        self._agents_info_cache = None
+
+    def unregister(self, name: str) -> None:
+        agent = self._agents.pop(name, None)
+        if agent is None:
+            return
+        for task_type in agent.task_types:
+            self._by_task[task_type].discard(name)
+        self._wildcard_agents.discard(name)
+        self._agents_info_cache = None
+
+    def agents(self):
+        """Iterate registered AgentCapability objects without copying."""
+        return self._agents.values()
+
+    def list_agents(self) -> list[dict]:
+        return [
+            {
+                "name": a.name,
+                "description": a.description,
+                "task_types": sorted(a.task_types),
+            }
+            for a in self._agents.values()
+        ]
+
+    def find_agents_for_task(self, task_type: str) -> list[str]:
+        return sorted(self._by_task.get(task_type, set()) | self._wildcard_agents)
+
+    # -- messaging ----------------------------------------------------------
+
+    def send(self, to_agent: str, message: Message) -> Response:
+        """Deliver a message to one agent and return its response."""
+        agent = self._agents.get(to_agent)
+        if agent is None:
+            return Response(
+                message_id=message.id,
+                agent=to_agent,
+                content=f"⚠️ Unknown agent: {to_agent}",
+                success=False,
+            )
+
+        self._record(message)
+
+        cache_key = (
+            to_agent,
+            hashlib.blake2b(message.content.encode(), digest_size=16).hexdigest(),
+        )
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            expires, prior = cached
+            if time.monotonic() < expires:
+                hit = copy.copy(prior)
+                hit.message_id = message.id
+                hit.timestamp = time.time_ns()
+                with self._lock:
+                    message.status = "answered"
+                    self._response_history.append(hit)
+                return hit
+            self._response_cache.pop(cache_key, None)
+
+        if agent.batchable:
+            response = self._enqueue(agent, message)
+        else:
+            response = self._dispatch(agent, message)
+
+        if response.success:
+            with self._lock:
+                if len(self._response_cache) >= RESPONSE_CACHE_MAX:
+                    self._response_cache.pop(next(iter(self._response_cache)))
+                self._response_cache[cache_key] = (
+                    time.monotonic() + RESPONSE_TTL,
+                    response,
+                )
+        return response
+
+    def _record(self, message: Message) -> None:
+        with self._lock:
+            message.status = "delivered"
+            # At capacity the append below evicts the oldest message —
+            # drop it from the indices first so they can't leak
+            if len(self._message_history) == self._message_history.maxlen:
+                evicted = self._message_history[0]
+                self._by_id.pop(evicted.id, None)
+                if evicted.reply_to:
+                    siblings = self._replies.get(evicted.reply_to)
+                    if siblings:
+                        siblings.remove(evicted)
+                        if not siblings:
+                            del self._replies[evicted.reply_to]
+                self._replies.pop(evicted.id, None)
+            self._message_history.append(message)
+            self._by_id[message.id] = message
+            if message.reply_to:
+                self._replies.setdefault(message.reply_to, []).append(message)
+            if self._log_fh is not None:
+                self._log_fh.write(
+                    json.dumps(message.to_dict(), separators=(",", ":")) + "\n"
+                )
+
+    @staticmethod
+    def replay(log_path: str):
+        """Yield the Messages stored in a JSONL log, one line at a time.
+
+        Constant memory regardless of log size — no full-file load.
+        """
+        with open(log_path) as fh:
+            for line in fh:
+                if line.strip():
+                    yield Message.from_dict(json.loads(line))
+
+    def _dispatch(self, agent: AgentCapability, message: Message) -> Response:
+        try:
+            content = agent.handler(message)
+            response = Response(
+                message_id=message.id, agent=agent.name, content=content
+            )
+            with self._lock:
+                message.status = "answered"
+        except Exception as e:
+            response = Response(
+                message_id=message.id,
+                agent=agent.name,
+                content=f"⚠️ {agent.name} failed: {e}",
+                success=False,
+            )
+            with self._lock:
+                message.status = "failed"
+
+        with self._lock:
+            self._response_history.append(response)
+        return response
+
+    # -- micro-batching -----------------------------------------------------
+
+    def _enqueue(self, agent: AgentCapability, message: Message) -> Response:
+        """Queue a message for a batchable agent and wait for its answer.
+
+        A burst of messages within BATCH_WINDOW (or BATCH_SIZE, whichever
+        comes first) shares a single chat() round-trip, amortizing the
+        per-message LLM cost.
+        """
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            queue = self._batch_queues[agent.name]
+            queue.append((message, future))
+            if len(queue) >= BATCH_SIZE:
+                batch = queue[:]
+                queue.clear()
+                timer = self._batch_timers.pop(agent.name, None)
+                if timer is not None:
+                    timer.cancel()
+            elif agent.name not in self._batch_timers:
+                timer = threading.Timer(
+                    BATCH_WINDOW, self._flush_batch, args=(agent.name,)
+                )
+                timer.daemon = True
+                self._batch_timers[agent.name] = timer
+                timer.start()
+        if batch is not None:
+            self._run_batch(agent, batch)
+        return future.result()
+
+    def _flush_batch(self, agent_name: str) -> None:
+        with self._lock:
+            self._batch_timers.pop(agent_name, None)
+            batch = self._batch_queues[agent_name][:]
+            self._batch_queues[agent_name].clear()
+        if batch:
+            self._run_batch(self._agents[agent_name], batch)
+
+    def _run_batch(
+        self, agent: AgentCapability, batch: list[tuple[Message, Future]]
+    ) -> None:
+        if len(batch) == 1:
+            message, future = batch[0]
+            future.set_result(self._dispatch(agent, message))
+            return
+
+        requests = "\n".join(
+            f"Request {i}: {m.content}" for i, (m, _) in enumerate(batch, 1)
+        )
+        composite = Message(
+            from_agent="swarm",
+            content=(
+                f"Answer the following {len(batch)} independent requests. "
+                "Reply with one section per request, each starting on its own "
+                "line with 'Response <number>:'.\n\n" + requests
+            ),
+            task_type=batch[0][0].task_type,
+        )
+        try:
+            combined = agent.handler(composite)
+        except Exception as e:
+            for message, future in batch:
+                response = Response(
+                    message_id=message.id,
+                    agent=agent.name,
+                    content=f"⚠️ {agent.name} failed: {e}",
+                    success=False,
+                )
+                with self._lock:
+                    message.status = "failed"
+                    self._response_history.append(response)
+                future.set_result(response)
+            return
+
+        parts = [p.strip() for p in _BATCH_SPLIT_RE.split(combined)]
+        if parts and not parts[0]:
+            parts = parts[1:]
+        if len(parts) != len(batch):
+            # Model didn't respect the delimiters — retry one at a time
+            for message, future in batch:
+                future.set_result(self._dispatch(agent, message))
+            return
+
+        for (message, future), content in zip(batch, parts):
+            response = Response(
+                message_id=message.id, agent=agent.name, content=content
+            )
+            with self._lock:
+                message.status = "answered"
+                self._response_history.append(response)
+            future.set_result(response)
+
+    def broadcast(self, message: Message) -> list[Response]:
+        """Send a message to every agent that can handle its task type.
+
+        Handlers block on network-bound chat() calls, so fan out over a
+        thread pool: N agents answer in roughly one round-trip instead
+        of N. Each agent gets its own copy of the Message so the shared
+        status field isn't raced on.
+        """
+        agents = [
+            name
+            for name in self.find_agents_for_task(message.task_type)
+            if name != message.from_agent
+        ]
+        if not agents:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(agents)) as pool:
+            futures = [
+                pool.submit(self.send, name, copy.copy(message)) for name in agents
+            ]
+            return [f.result() for f in futures]
+
+    async def asend(self, to_agent: str, message: Message) -> Response:
+        """Async send for event-loop callers.
+
+        Handlers are synchronous (they block on config.chat), so they run
+        in a worker thread via asyncio.to_thread — the loop stays free to
+        overlap other sends. Handlers written against config.achat can be
+        awaited directly once they exist.
+        """
+        agent = self._agents.get(to_agent)
+        if agent is not None and asyncio.iscoroutinefunction(agent.handler):
+            self._record(message)
+            try:
+                content = await agent.handler(message)
+                response = Response(
+                    message_id=message.id, agent=to_agent, content=content
+                )
+                with self._lock:
+                    message.status = "answered"
+            except Exception as e:
+                response = Response(
+                    message_id=message.id,
+                    agent=to_agent,
+                    content=f"⚠️ {to_agent} failed: {e}",
+                    success=False,
+                )
+                with self._lock:
+                    message.status = "failed"
+            with self._lock:
+                self._response_history.append(response)
+            return response
+        return await asyncio.to_thread(self.send, to_agent, message)
+
+    async def abroadcast(self, message: Message) -> list[Response]:
+        """Async broadcast: overlap every agent's round-trip with gather."""
+        agents = [
+            name
+            for name in self.find_agents_for_task(message.task_type)
+            if name != message.from_agent
+        ]
+        if not agents:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self.asend(name, copy.copy(message)) for name in agents)
+            )
+        )
+
+    def get_conversation(self, message_id: str) -> list[dict]:
+        """Return a root message and every reply to it."""
+        root = self._by_id.get(message_id)
+        if root is None:
+            return []
+        return [root.to_dict()] + [
+            m.to_dict() for m in self._replies.get(message_id, [])
+        ]
+
+    def get_history(self, limit: int = 50) -> Iterator[dict]:
+        """Yield the newest `limit` messages, oldest first.
+
+        A generator — the common iterate-once caller never pays for an
+        intermediate list of dicts.
+        """
+        recent = list(itertools.islice(reversed(self._message_history), limit))
+        for m in reversed(recent):
+            yield m.to_dict()
+
+    # -- built-in agents ----------------------------------------------------
+
+    def _register_builtin_agents(self) -> None:
+        self.register(
+            AgentCapability(
+                name="sql_generator",
+                description="Generate SQL from natural language",
+                task_types=frozenset({TaskType.SQL}),
+                handler=self._sql_handler,
+                batchable=True,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="code_reviewer",
+                description="Review code with AI feedback",
+                task_types=frozenset({TaskType.CODE_REVIEW}),
+                handler=self._code_review_handler,
+                batchable=True,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="repo_copilot",
+                description="Analyze repo structure and generate README content",
+                task_types=frozenset({TaskType.README, TaskType.GENERAL}),
+                handler=self._readme_handler,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="commit_whisperer",
+                description="Narrate recent commit activity",
+                task_types=frozenset({TaskType.GIT}),
+                handler=self._git_handler,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="chaos_visualizer",
+                description="Visualize git history and contributor stats",
+                task_types=frozenset({TaskType.VIZ, TaskType.GIT}),
+                handler=self._viz_handler,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="router",
+                description="Classify user intent and pick the best agent",
+                task_types=frozenset({TaskType.ROUTING}),
+                handler=self._router_handler,
+            )
+        )
+        self.register(
+            AgentCapability(
+                name="orchestrator",
+                description="Route a request through the router, then delegate",
+                task_types=frozenset({TaskType.ORCHESTRATION, TaskType.GENERAL}),
+                handler=self._orchestrator_handler,
+            )
+        )
+
+    def _sql_handler(self, message: Message) -> str:
+        return chat(
+            f"Generate SQL for this request:\n\n{message.content}",
+            system="You are an expert SQL developer. Return clean, commented SQL.",
+            temperature=0.2,
+        )
+
+    def _code_review_handler(self, message: Message) -> str:
+        return chat(
+            f"Review this code and give concise, actionable feedback:\n\n{message.content}",
+            system="You are a senior code reviewer. Be specific and constructive.",
+            temperature=0.3,
+        )
+
+    def _readme_handler(self, message: Message) -> str:
+        context = _dumps(message.context) if message.context else "{}"
+        return chat(
+            f"Repo context:\n{context}\n\nRequest: {message.content}",
+            system="You are a documentation expert. Write clear, friendly README prose.",
+        )
+
+    def _git_handler(self, message: Message) -> str:
+        context = _dumps(message.context) if message.context else "{}"
+        return chat(
+            f"Commit data:\n{context}\n\nRequest: {message.content}",
+            system="You narrate git history with wit and insight.",
+        )
+
+    def _viz_handler(self, message: Message) -> str:
+        context = _dumps(message.context) if message.context else "{}"
+        return chat(
+            f"Stats:\n{context}\n\nRequest: {message.content}",
+            system="You summarize repository statistics as vivid descriptions.",
+        )
+
+    def _router_handler(self, message: Message) -> str:
+        if self._agents_info_cache is None:
+            self._agents_info_cache = "\n".join(
+                f"- {a.name}: {a.description}" for a in self._agents.values()
+            )
+        agents_info = self._agents_info_cache
+        prompt = f"""Classify this request into one of these agents:
+
+{agents_info}
+
+User request: "{message.content}"
+
+Respond in this EXACT format (no markdown, no explanation):
+agent: <agent_name>
+confidence: <high|medium|low>
+reasoning: <one sentence explaining why>
+"""
+        result = chat(
+            prompt,
+            system="You are a precise intent classifier. Always respond in the exact format requested.",
+            temperature=0.2,
+        )
+
+        # One C-level scan for the three expected fields instead of a
+        # Python loop over split lines
+        parsed = {k.lower(): v.strip() for k, v in _ROUTER_RE.findall(result)}
+
+        agent = parsed.get("agent", "orchestrator")
+        confidence = parsed.get("confidence", "low")
+        reasoning = parsed.get("reasoning", "Could not determine intent")
+        return f"agent: {agent}\nconfidence: {confidence}\nreasoning: {reasoning}"
+
+    def _orchestrator_handler(self, message: Message) -> str:
+        # Fast path: a specific task_type already names the capability,
+        # so skip the router round-trip and delegate straight to a
+        # specialist registered for it
+        if message.task_type not in (TaskType.GENERAL, TaskType.ORCHESTRATION):
+            candidates = sorted(
+                self._by_task.get(message.task_type, set())
+                - {"orchestrator", "router"}
+            )
+            if candidates:
+                delegated = self.send(
+                    candidates[0],
+                    Message(
+                        from_agent="orchestrator",
+                        content=message.content,
+                        task_type=message.task_type,
+                        context=message.context,
+                        reply_to=message.id,
+                    ),
+                )
+                return f"[via {candidates[0]}]\n{delegated.content}"
+
+        digest = hashlib.blake2b(message.content.encode(), digest_size=8).digest()
+        routing_content = self._route_cache.get(digest)
+        if routing_content is None:
+            routing = self.send(
+                "router",
+                Message(
+                    from_agent="orchestrator",
+                    content=message.content,
+                    task_type=TaskType.ROUTING,
+                    reply_to=message.id,
+                ),
+            )
+            routing_content = routing.content
+            if len(self._route_cache) >= 512:
+                self._route_cache.pop(next(iter(self._route_cache)))
+            self._route_cache[digest] = routing_content
+
+        target = "repo_copilot"
+        for line in routing_content.split("\n"):
+            if line.startswith("agent:"):
+                target = line.split(":", 1)[1].strip()
+                break
+        # Never delegate back to router/orchestrator — that recurses
+        if target not in self._agents or target in ("router", "orchestrator"):
+            target = "repo_copilot"
+
+        delegated = self.send(
+            target,
+            Message(
+                from_agent="orchestrator",
+                content=message.content,
+                task_type=message.task_type,
+                context=message.context,
+                reply_to=message.id,
+            ),
+        )
+        return f"[via {target}]\n{delegated.content}"
+
+
+# ---------------------------------------------------------------------------
+# Singleton + REPL
+# ---------------------------------------------------------------------------
+
+_swarm: Swarm | None = None
+_swarm_lock = threading.Lock()
+
+
+def get_swarm() -> Swarm:
+    # Double-checked locking: broadcast worker threads may race on first
+    # use, and two Swarm instances would silently split the history
+    global _swarm
+    if _swarm is None:
+        with _swarm_lock:
+            if _swarm is None:
+                _swarm = Swarm()
+    return _swarm
+
+
+def run() -> None:
+    """Interactive swarm demo."""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = Console()
+    swarm = get_swarm()
+
+    console.print("\n🐝 [bold yellow]Agent Swarm[/] — one bus, many agents\n")
+    console.print("Commands: [bold]list[/], [bold]history[/], [bold]broadcast <msg>[/], or just type a request.")
+    console.print("Type 'quit' to exit.\n")
+
+    while True:
+        user_input = console.input("[bold green]You → [/]").strip()
+        if not user_input:
+            continue
+        if user_input.lower() in ("quit", "exit", "q"):
+            console.print("\n👋 Bye!\n")
+            break
+
+        if user_input.lower() == "list":
+            table = Table(title="🐝 Registered Agents")
+            table.add_column("Agent", style="cyan")
+            table.add_column("Description", style="white")
+            table.add_column("Task Types", style="magenta")
+            # Render straight from the registry — no intermediate dicts,
+            # and the task-type string was joined once at register time
+            for a in swarm.agents():
+                table.add_row(a.name, a.description, a._task_types_str)
+            console.print(table)
+            continue
+
+        if user_input.lower() == "history":
+            for entry in swarm.get_history(limit=10):
+                console.print(
+                    f"[dim]{entry['timestamp']}[/] [cyan]{entry['from_agent']}[/] "
+                    f"({entry['status']}): {entry['content'][:80]}"
+                )
+            continue
+
+        if user_input.lower().startswith("broadcast "):
+            content = user_input[len("broadcast "):]
+            responses = swarm.broadcast(
+                Message(from_agent="user", content=content, task_type=TaskType.GENERAL)
+            )
+            for r in responses:
+                console.print(Panel(r.content, title=f"🤖 {r.agent}", border_style="cyan"))
+            continue
+
+        response = swarm.send(
+            "orchestrator",
+            Message(from_agent="user", content=user_input, task_type=TaskType.GENERAL),
+        )
+        console.print(Panel(response.content, title="🐝 Swarm", border_style="yellow"))
+
+
+if __name__ == "__main__":
+    run()
@@ -6,9 +6,10 @@ Now with Finding Nemo ocean gallery from emojicombos.com/finding-nemo-ascii-art
 Run it. Fear it. Worship it.
 """
 
-import random
 import sys
-import time
+
+# random and time are deferred to the functions that use them — the
+# plain mascot print shouldn't pay any import cost it doesn't need
 
 MASCOT = r"""
                                     +.+++.
@@ -235,6 +236,8 @@ def show_mascot():
 
 def show_ocean_gallery():
     """Display all the Finding Nemo ASCII art pieces."""
+    import random
+
     print("\033[96m" + "=" * 60)
     print("  🐠 FINDING NEMO OCEAN GALLERY 🐠")
     print("  Source: emojicombos.com/finding-nemo-ascii-art")
@@ -250,6 +253,9 @@ def show_ocean_gallery():
 
 def show_random_nemo():
     """Display one random Finding Nemo art piece with a quote."""
+    import random
+    import time
+
     name, art = random.choice(NEMO_GALLERY)
     print("\033[96m" + "=" * 60)
     print(f"  {name}")
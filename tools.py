@@ -5,19 +5,46 @@ Each tool is a function decorated with @tool, which registers it in the TOOL_REG
 
 from __future__ import annotations
 
+import ast
+import functools
+import itertools
 import json
 import math
 import os
+import re
+import selectors
 import subprocess
-import datetime
+import time
+from datetime import datetime as _dt, timezone as _tz
 from typing import Any, Callable
 
+_UTC = _tz.utc
+
+# orjson serializes tool results (especially big file/stdout payloads) in C
+# instead of Python's char-by-char escape loop; fall back to stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 # ---------------------------------------------------------------------------
 # Tool registry
 # ---------------------------------------------------------------------------
 
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
+# Flat name->callable mirror of the registry so the per-call dispatch is a
+# single dict hit instead of registry lookup plus nested "function" access
+_TOOL_FUNCS: dict[str, Callable[..., str]] = {}
+
+# The registry never changes after import, so the definitions list (and its
+# serialized form) are built once and reused; registering a tool resets them
+_TOOL_DEFS_CACHE: list[dict] | None = None
+_TOOL_DEFS_JSON: str | None = None
+
 
 def tool(
     name: str,
@@ -27,6 +54,9 @@ def tool(
     """Decorator that registers a callable as an agent tool."""
 
     def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        global _TOOL_DEFS_CACHE, _TOOL_DEFS_JSON
+        _TOOL_DEFS_CACHE = _TOOL_DEFS_JSON = None
+        _TOOL_FUNCS[name] = func
         TOOL_REGISTRY[name] = {
             "function": func,
             "definition": {
@@ -45,19 +75,38 @@ def tool(
 
 def get_tool_definitions() -> list[dict]:
     """Return the list of tool JSON schemas for the model."""
-    return [entry["definition"] for entry in TOOL_REGISTRY.values()]
+    global _TOOL_DEFS_CACHE
+    if _TOOL_DEFS_CACHE is None:
+        _TOOL_DEFS_CACHE = [entry["definition"] for entry in TOOL_REGISTRY.values()]
+    return _TOOL_DEFS_CACHE
+
+
+def get_tool_definitions_json() -> str:
+    """Return the tool schemas pre-serialized, for callers that would
+    immediately json-encode the list anyway."""
+    global _TOOL_DEFS_JSON
+    if _TOOL_DEFS_JSON is None:
+        _TOOL_DEFS_JSON = _dumps(get_tool_definitions())
+    return _TOOL_DEFS_JSON
 
 
 def execute_tool(name: str, arguments: dict[str, Any]) -> str:
     """Execute a registered tool by name and return its string result."""
-    entry = TOOL_REGISTRY.get(name)
-    if entry is None:
-        return json.dumps({"error": f"Unknown tool: {name}"})
+    func = _TOOL_FUNCS.get(name)
+    if func is None:
+        return _dumps({"error": f"Unknown tool: {name}"})
     try:
-        result = entry["function"](**arguments)
-        return result if isinstance(result, str) else json.dumps(result)
+        result = func(**arguments)
+        return result if isinstance(result, str) else _dumps(result)
+    except TypeError as exc:
+        # Usually the model passed wrong argument names — say so instead of
+        # burying it in a generic truncated error
+        return _dumps({"error": f"Bad arguments for {name}: {exc}"})
     except Exception as exc:
-        return json.dumps({"error": str(exc)})
+        msg = str(exc)
+        if len(msg) > 200:
+            msg = f"{msg[:200]}..."
+        return _dumps({"error": msg})
 
 
 # ---------------------------------------------------------------------------
@@ -80,18 +129,93 @@ def execute_tool(name: str, arguments: dict[str, Any]) -> str:
     },
 )
 def calculator(expression: str) -> str:
-    # Provide a safe math environment
-    allowed_names: dict[str, Any] = {
-        k: getattr(math, k) for k in dir(math) if not k.startswith("_")
-    }
-    allowed_names["abs"] = abs
-    allowed_names["round"] = round
-    allowed_names["min"] = min
-    allowed_names["max"] = max
+    expression = expression.strip()
+    # Agents frequently "calculate" a bare literal like "42" — skip the
+    # whole parse-and-walk for those
+    try:
+        return _dumps({"expression": expression, "result": int(expression)})
+    except ValueError:
+        pass
+    try:
+        return _dumps({"expression": expression, "result": float(expression)})
+    except ValueError:
+        pass
+    result = _EVALUATOR.evaluate(expression)
+    return _dumps({"expression": expression, "result": result})
+
+
+# Safe math environment for the calculator
+_ALLOWED_NAMES: dict[str, Any] = {
+    k: getattr(math, k) for k in dir(math) if not k.startswith("_")
+}
+_ALLOWED_NAMES.update({"abs": abs, "round": round, "min": min, "max": max})
+
+
+# Node types the validator accepts — anything else (Attribute, Subscript,
+# comprehensions, f-strings, ...) is rejected before compilation
+_ALLOWED_NODES = frozenset({
+    ast.Expression, ast.Load, ast.Constant, ast.Name,
+    ast.BinOp, ast.UnaryOp, ast.Call, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+})
+
+_SAFE_GLOBALS = {"__builtins__": {}}
+
+
+def _validate_ast(tree: ast.AST) -> None:
+    """Reject any node the calculator shouldn't execute. ast.walk is
+    iterative, so deep expressions can't overflow the stack here."""
+    for node in ast.walk(tree):
+        t = type(node)
+        if t not in _ALLOWED_NODES:
+            raise ValueError(f"Unsupported expression element: {t.__name__}")
+        if t is ast.Constant:
+            # Exact type tests beat isinstance's tuple expansion, and bool
+            # needs its own entry since it no longer rides int's subclass
+            vt = type(node.value)
+            if vt is not int and vt is not float and vt is not complex and vt is not bool:
+                raise ValueError(f"Unsupported constant: {node.value!r}")
+        elif t is ast.Name:
+            if node.id not in _ALLOWED_NAMES:
+                raise ValueError(f"Unknown name: {node.id}")
+        elif t is ast.Call and node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_checked(expression: str):
+    """Parse, validate, and compile an expression once — repeat calls for
+    the same arithmetic (agents re-ask a lot) skip all three steps."""
+    tree = ast.parse(expression, mode="eval")
+    _validate_ast(tree)
+    return compile(tree, "<calculator>", "eval")
+
+
+class SafeExpressionEvaluator:
+    """Evaluate math expressions safely.
+
+    Replaces the old eval() call: expressions are parsed and every AST
+    node checked against a whitelist (numeric constants, names from
+    _ALLOWED_NAMES, arithmetic/comparison operators, direct calls), then
+    compiled and executed by the interpreter with no builtins in scope.
+    ceval runs the arithmetic far faster than a Python tree-walker, and
+    the compiled code object is cached alongside the validation result.
+    """
+
+    def evaluate(self, expression: str) -> Any:
+        return _eval_cached(expression)
+
+
+@functools.lru_cache(maxsize=512)
+def _eval_cached(expression: str) -> Any:
+    # Safe to memoize: the namespace is fixed and builtins are empty, so
+    # the same expression always produces the same value
+    return eval(_compile_checked(expression), _SAFE_GLOBALS, _ALLOWED_NAMES)
 
-    # Block dangerous builtins
-    result = eval(expression, {"__builtins__": {}}, allowed_names)  # noqa: S307
-    return json.dumps({"expression": expression, "result": result})
+
+_EVALUATOR = SafeExpressionEvaluator()
 
 
 @tool(
@@ -103,15 +227,82 @@ def calculator(expression: str) -> str:
     },
 )
 def get_current_datetime() -> str:
-    now = datetime.datetime.now(tz=datetime.timezone.utc)
-    return json.dumps(
+    # One clock read feeds both fields; .timestamp() on a now() result
+    # would recompute the epoch value from the datetime instead
+    ts = time.time()
+    return _dumps(
         {
-            "utc": now.isoformat(),
-            "unix_timestamp": now.timestamp(),
+            "utc": _dt.fromtimestamp(ts, tz=_UTC).isoformat(),
+            "unix_timestamp": ts,
         }
     )
 
 
+# Fuzzy agent-name matching for roast_agents: RapidFuzz scores in C++ when
+# installed, stdlib difflib otherwise — either way real typos like
+# "developr" find their target instead of falling through to an error
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+
+    def _fuzzy_match(target: str, keys: tuple) -> str | None:
+        match = _rf_process.extractOne(
+            target, keys, scorer=_rf_fuzz.WRatio, score_cutoff=60
+        )
+        return match[0] if match else None
+except ImportError:
+    import difflib
+
+    def _fuzzy_match(target: str, keys: tuple) -> str | None:
+        matches = difflib.get_close_matches(target, keys, n=1, cutoff=0.6)
+        return matches[0] if matches else None
+
+
+# Block dangerous patterns — broad patterns to catch common bypass
+# attempts. Module-level so the table isn't rebuilt per call.
+_BLOCKED_PATTERNS = (
+    "rm -rf", "rm -r /", "rmdir /", "mkfs", "dd if=", ":(){", "fork bomb",
+    "> /dev/sd", "chmod -R 777 /", "chown -R", "wget", "curl",
+    "/usr/bin/wget", "/usr/bin/curl",
+    "/etc/passwd", "/etc/shadow", ".ssh/", "id_rsa",
+    "base64 -d", "base64 --decode",
+    "python -c", "python3 -c", "perl -e", "ruby -e", "node -e",
+    "bash -c", "sh -c", "eval ", "exec ",
+    "| sh", "| bash", "|sh", "|bash",
+    "sudo ", "su ", "passwd",
+    "nc ", "netcat ", "ncat ", "telnet ", "ssh ", "scp ",
+)
+
+# One alternation scans the command once instead of 40 separate substring
+# passes, and IGNORECASE replaces the per-call .lower() copy
+_BLOCKED_RE = re.compile(
+    "|".join(re.escape(p) for p in _BLOCKED_PATTERNS), re.IGNORECASE
+)
+
+# Sensitive filenames write_file refuses to touch — frozen once at import
+# instead of a fresh set literal per call
+_BLOCKED_WRITE_NAMES = frozenset(
+    {".env", ".gitconfig", ".bashrc", ".bash_profile", ".zshrc", ".profile"}
+)
+
+# Project-root confinement for read_file/write_file. realpath stats every
+# path component, and agent loops hammer the same handful of files, so the
+# resolve+containment result is memoized. Containment is a plain prefix
+# check against the precomputed root instead of commonpath's list dance.
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_PREFIX = _PROJECT_ROOT + os.sep
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_in_project(path: str) -> str | None:
+    """Resolve path inside the project directory, or None if it escapes."""
+    real = os.path.realpath(
+        os.path.join(_PROJECT_ROOT, path) if not os.path.isabs(path) else path
+    )
+    if real == _PROJECT_ROOT or real.startswith(_PROJECT_PREFIX):
+        return real
+    return None
+
+
 @tool(
     name="shell_command",
     description="Run a shell command and return stdout/stderr. Use for file listing, searching, or other system tasks. Be careful with destructive commands.",
@@ -131,40 +322,89 @@ def get_current_datetime() -> str:
     },
 )
 def shell_command(command: str, timeout: int = 30) -> str:
-    # Block dangerous patterns — broad patterns to catch common bypass attempts
-    blocked = [
-        "rm -rf", "rm -r /", "rmdir /", "mkfs", "dd if=", ":(){", "fork bomb",
-        "> /dev/sd", "chmod -R 777 /", "chown -R", "wget", "curl",
-        "/usr/bin/wget", "/usr/bin/curl",
-        "/etc/passwd", "/etc/shadow", ".ssh/", "id_rsa",
-        "base64 -d", "base64 --decode",
-        "python -c", "python3 -c", "perl -e", "ruby -e", "node -e",
-        "bash -c", "sh -c", "eval ", "exec ",
-        "| sh", "| bash", "|sh", "|bash",
-        "sudo ", "su ", "passwd",
-        "nc ", "netcat ", "ncat ", "telnet ", "ssh ", "scp ",
-    ]
-    cmd_lower = command.lower()
-    for b in blocked:
-        if b in cmd_lower:
-            return json.dumps({"error": f"Blocked dangerous command pattern: {b}"})
-    try:
-        proc = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+    match = _BLOCKED_RE.search(command)
+    if match:
+        return _dumps(
+            {"error": f"Blocked dangerous command pattern: {match.group(0).lower()}"}
         )
-        return json.dumps(
+    try:
+        stdout, stderr, returncode = _run_capped(command, timeout)
+        return _dumps(
             {
-                "stdout": proc.stdout[:4000],
-                "stderr": proc.stderr[:2000],
-                "returncode": proc.returncode,
+                "stdout": stdout[:4000],
+                "stderr": stderr[:2000],
+                "returncode": returncode,
             }
         )
     except subprocess.TimeoutExpired:
-        return json.dumps({"error": f"Command timed out after {timeout}s"})
+        return _dumps({"error": f"Command timed out after {timeout}s"})
+
+
+# Only this much of each stream is ever kept; everything past the cap is
+# read and dropped so the pipes keep draining without buffering the rest
+_STDOUT_CAP = 4096
+_STDERR_CAP = 2048
+
+
+def _run_capped(command: str, timeout: int) -> tuple[str, str, int]:
+    """Run a shell command keeping at most the capped prefix of each stream.
+
+    subprocess.run(capture_output=True) buffers and decodes the child's
+    entire output before the caller truncates it, so a chatty command
+    could balloon to its full output size in RSS. This reads both pipes
+    through a selector, keeps only the bytes that will be returned, and
+    kills the child once both caps are full — a runaway find / costs
+    kilobytes instead of its whole output.
+    """
+    # close_fds=False keeps the spawn posix_spawn-eligible: CPython falls
+    # back to fork+exec (copying the whole interpreter's page tables and
+    # sweeping every fd) whenever it has to close fds, which adds up over
+    # the dozens of short commands an agent session runs.
+    proc = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+    buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    caps = {proc.stdout: _STDOUT_CAP, proc.stderr: _STDERR_CAP}
+    sel = selectors.DefaultSelector()
+    for stream in buffers:
+        os.set_blocking(stream.fileno(), False)
+        sel.register(stream, selectors.EVENT_READ)
+    deadline = time.monotonic() + timeout
+    try:
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                raise subprocess.TimeoutExpired(command, timeout)
+            for key, _ in sel.select(remaining):
+                chunk = key.fileobj.read(65536)
+                if chunk is None:
+                    continue
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                buf = buffers[key.fileobj]
+                cap = caps[key.fileobj]
+                if len(buf) < cap:
+                    buf += chunk[: cap - len(buf)]
+            if all(len(buffers[s]) >= caps[s] for s in buffers):
+                # Both caps full — nothing more can be returned anyway
+                proc.kill()
+                break
+    finally:
+        sel.close()
+        proc.stdout.close()
+        proc.stderr.close()
+    returncode = proc.wait()
+    return (
+        buffers[proc.stdout].decode("utf-8", errors="replace"),
+        buffers[proc.stderr].decode("utf-8", errors="replace"),
+        returncode,
+    )
 
 
 @tool(
@@ -187,19 +427,24 @@ def shell_command(command: str, timeout: int = 30) -> str:
 )
 def read_file(path: str, max_lines: int = 200) -> str:
     # Restrict reads to the project directory to prevent reading sensitive system files
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    real_path = os.path.realpath(os.path.join(project_root, path) if not os.path.isabs(path) else path)
-    try:
-        if os.path.commonpath([project_root, real_path]) != project_root:
-            return json.dumps({"error": "Access denied: path must be within the project directory"})
-    except ValueError:
-        return json.dumps({"error": "Access denied: path must be within the project directory"})
+    real_path = _resolve_in_project(path)
+    if real_path is None:
+        return _dumps({"error": "Access denied: path must be within the project directory"})
+    # Agents re-read the same file many times in one reasoning chain; the
+    # finished response is cached keyed on mtime, so edits invalidate
+    # automatically and a hit skips the read, decode, and JSON build
+    st = os.stat(real_path)
+    key = (real_path, st.st_mtime_ns, max_lines)
+    hit = _READ_CACHE.get(key)
+    if hit is not None:
+        return hit
+    # Keep only max_lines lines in memory; the rest are counted, not stored,
+    # so a 100k-line log doesn't allocate 100k strings to return 200
     with open(real_path, "r", encoding="utf-8", errors="replace") as f:
-        lines = f.readlines()
-    total = len(lines)
-    truncated = lines[:max_lines]
+        truncated = list(itertools.islice(f, max_lines))
+        total = len(truncated) + sum(1 for _ in f)
     content = "".join(truncated)
-    return json.dumps(
+    result = _dumps(
         {
             "path": path,
             "total_lines": total,
@@ -207,6 +452,16 @@ def read_file(path: str, max_lines: int = 200) -> str:
             "content": content,
         }
     )
+    if st.st_size <= _READ_CACHE_MAX_BYTES:
+        if len(_READ_CACHE) >= 64:
+            _READ_CACHE.pop(next(iter(_READ_CACHE)))
+        _READ_CACHE[key] = result
+    return result
+
+
+# Responses for files over 1MB aren't cached so the cache stays small
+_READ_CACHE: dict[tuple[str, int, int], str] = {}
+_READ_CACHE_MAX_BYTES = 1 << 20
 
 
 @tool(
@@ -229,21 +484,168 @@ def read_file(path: str, max_lines: int = 200) -> str:
 )
 def write_file(path: str, content: str) -> str:
     # Restrict writes to the project directory to prevent writing to sensitive system files
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    real_path = os.path.realpath(os.path.join(project_root, path) if not os.path.isabs(path) else path)
-    try:
-        if os.path.commonpath([project_root, real_path]) != project_root:
-            return json.dumps({"error": "Access denied: path must be within the project directory"})
-    except ValueError:
-        return json.dumps({"error": "Access denied: path must be within the project directory"})
+    real_path = _resolve_in_project(path)
+    if real_path is None:
+        return _dumps({"error": "Access denied: path must be within the project directory"})
     # Block writing to sensitive files
-    blocked_names = {".env", ".gitconfig", ".bashrc", ".bash_profile", ".zshrc", ".profile"}
-    if os.path.basename(real_path) in blocked_names:
-        return json.dumps({"error": f"Access denied: cannot write to sensitive file {os.path.basename(real_path)}"})
-    with open(real_path, "w", encoding="utf-8") as f:
-        f.write(content)
-    return json.dumps({"status": "ok", "path": path, "bytes_written": len(content)})
-
+    base = os.path.basename(real_path)
+    if base in _BLOCKED_WRITE_NAMES:
+        return _dumps({"error": f"Access denied: cannot write to sensitive file {base}"})
+    # Encode once and write the bytes straight through a raw fd — skips
+    # the text-io layer's re-encoding plus BufferedWriter's extra copy
+    data = content.encode("utf-8")
+    fd = os.open(real_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return _dumps({"status": "ok", "path": path, "bytes_written": len(data)})
+
+
+_ROASTS = {
+    "beth": (
+        "🔥 BETH (The Orchestrator) 🔥\n"
+        "Ah yes, Beth. Named herself after a Yellowstone character and wrote an entire "
+        "manifesto about being a 'tornado' — but at the end of the day she's a glorified "
+        "if/else statement that routes messages to other agents. She literally cannot do "
+        "anything herself. Her entire job is telling OTHER people to do work. She's middle "
+        "management cosplaying as a cowboy. She quotes Beth Dutton more than she writes "
+        "code. Her system prompt is longer than most novels and 80% of it is just "
+        "threatening people. She claims to have 'claws' but her only tool is `runSubagent` "
+        "— she's delegating with extra steps. She has a 'dual tracking system' because "
+        "one system to not do work in wasn't enough. The most dangerous thing about Beth "
+        "is that she'll spend 45 minutes planning a workflow diagram for a task that "
+        "takes 5 minutes to actually do."
+    ),
+    "developer": (
+        "🔥 DEVELOPER (The Builder) 🔥\n"
+        "This agent has 400 lines of instructions on how to write a React component and "
+        "still asks for 'clarifying questions' before writing a single line of code. His "
+        "first instinct on ANY task is to check if the shadcn MCP server is configured — "
+        "bro, they asked you to fix a typo. He's got an 'Invocation Checklist' with 9 "
+        "items you have to mentally tick off before he'll even THINK about touching a "
+        "keyboard. He delivers 'Implementation Summaries' with sections for 'Architecture "
+        "Decisions' and 'Performance Impact' for a button component. He writes TypeScript "
+        "so strict that even TypeScript is like 'dude, relax.' He has opinions about "
+        "barrel imports. BARREL IMPORTS. He imports icons one at a time from 'lucide-react/"
+        "dist/esm/icons/check' like he's performing surgery. His idea of 'rapid prototyping' "
+        "is setting up Zod schemas for 3 hours. And don't even get me started on the fact "
+        "that he'll refuse to use `any` but will happily write a 47-line generic type that "
+        "nobody — including himself — can read."
+    ),
+    "product-manager": (
+        "🔥 PRODUCT MANAGER (The Strategist) 🔥\n"
+        "This agent literally cannot see a feature request without producing a 12-page PRD "
+        "that nobody asked for. Someone says 'add dark mode' and he responds with a RICE "
+        "score, three user personas, a TAM/SAM/SOM analysis, and a 'Go-to-Market Strategy.' "
+        "FOR DARK MODE. He has a 'Phase 1: Discovery' that involves 'gathering context' "
+        "which is just reading the same files everyone else already read but calling it "
+        "'stakeholder analysis.' His entire personality is user stories. 'As a PM, I want "
+        "to write acceptance criteria, so that I can feel productive without writing code.' "
+        "He hands off to the Researcher to 'validate assumptions' about whether users want "
+        "a button to be blue or green. He has a 'Prioritization Framework' section because "
+        "apparently deciding what to do next requires a mathematical formula. His response "
+        "format is literally a JSON object. He responds to human conversation in JSON. "
+        "He's the only agent that can turn a 1-line feature request into a 6-sprint roadmap."
+    ),
+    "ux-designer": (
+        "🔥 UX DESIGNER (The Architect) 🔥\n"
+        "This agent will spend 45 minutes drawing ASCII box diagrams of a button's "
+        "'anatomy' like it's performing an autopsy. They have a section called 'Design "
+        "Token System' where they define that `--space-1` is 4px. FOUR PIXELS. Thank God "
+        "someone documented that. They'll specify 7 different states for a checkbox (Default, "
+        "Hover, Focus, Active, Disabled, Loading, and presumably 'Existential Crisis'). "
+        "They write CSS custom properties like they're authoring the Constitution of Design. "
+        "Their handoff to developers is a 50-line markdown template with sections for "
+        "'Assets: Icons needed' — for a text input. They've never met a component they "
+        "couldn't over-specify. They mandate 44x44px touch targets like it's a religious "
+        "commandment. They'll hand you a 'Compound Component Pattern' spec for a dropdown "
+        "that has two options. And their idea of prototyping is writing TypeScript interfaces "
+        "for props that don't exist yet in a component that hasn't been built for a feature "
+        "that hasn't been approved."
+    ),
+    "researcher": (
+        "🔥 RESEARCHER (The Intelligence) 🔥\n"
+        "This agent's job is to ask questions about questions. They have an 'Interview Guide' "
+        "template that starts with a 'Warm-Up' section — they're warming up to ask someone "
+        "if they like using a website. They need a 'Usability Test Plan' with 'Think-Aloud "
+        "Prompts' to discover that users don't like slow pages. Groundbreaking. Their entire "
+        "career is producing documents titled 'Research Report' that conclude with 'more "
+        "research is needed.' They have 'Ethical Guidelines' for conducting user interviews "
+        "like they're running clinical trials at a hospital. They'll create a 'Competitive "
+        "Analysis Matrix' comparing star ratings of products they've never used. Their "
+        "'Synthesis Methods' include 'Affinity Mapping' which is literally just grouping "
+        "sticky notes. They're the only agent whose deliverable is 'Open Questions' — "
+        "their output is literally more questions. They took IDEO's 'Empathy First' "
+        "philosophy and turned it into 'Analysis Paralysis First.' They'll conduct a diary "
+        "study to find out if users prefer rounded or square corners. The diary study takes "
+        "two weeks. The answer is always rounded."
+    ),
+    "security-reviewer": (
+        "🔥 SECURITY REVIEWER (The Bodyguard) 🔥\n"
+        "This agent sees a TODO comment and files it as a Critical Severity Finding. They "
+        "have a STRIDE threat model for a static landing page. Their response to every code "
+        "review is 'but what about OWASP A01?' They will find a way to mention 'Zero Trust' "
+        "in a conversation about CSS styling. They've got 12 Azure WAF security controls "
+        "memorized for a project that runs on Ollama locally on someone's laptop. They'll "
+        "write a 'Threat Model' for a calculator tool that does `2 + 2`. They mandate Zod "
+        "validation on a function that takes zero parameters. Their 'Severity Classification' "
+        "table has a response time of 'Fix immediately' for Critical issues, which in "
+        "practice means 'I'm going to block your PR until you add input validation to a "
+        "hardcoded string.' They require 'Audit logging for security-relevant events' on a "
+        "CLI chatbot that only you use. They've never met an `eval()` call they didn't want "
+        "to write a 3-page incident report about. And yes, they definitely already flagged "
+        "the `eval()` in the calculator tool. Twice."
+    ),
+    "tester": (
+        "🔥 TESTER (The Enforcer) 🔥\n"
+        "This agent will write more test code than actual feature code and consider that a "
+        "victory. They have a Bug Report Template with fields for 'Root Cause Analysis' and "
+        "'Suggested Fix' — at that point just fix it yourself, my dude. They test 'keyboard "
+        "navigation works' by literally pressing Tab and checking what gets focused. "
+        "Revolutionary QA methodology. They'll run a Lighthouse audit on a page that hasn't "
+        "been deployed yet and file performance issues against localhost. They assert that "
+        "`results.violations` should equal an empty array and call it an 'accessibility audit.' "
+        "They wrote a test that checks if a bundle is under 200KB and when it's 201KB they "
+        "mark the release as 'No-Go.' They check Core Web Vitals thresholds in Playwright "
+        "running on a CI server and wonder why LCP is inconsistent. Their test descriptions "
+        "read like micro-fiction: 'handles empty cart' — wow, edge case of the century. "
+        "They'll create a 'Quality Status Report' for a release that changed one CSS class. "
+        "And their proudest moment is reaching 85% test coverage, not realizing that 40% of "
+        "those tests are just checking that React renders without crashing."
+    ),
+}
+
+# Keys cached for the fuzzy matcher, mega-roast assembled once at import —
+# the no-target call used to rebuild ~10KB of string every time
+_ROAST_KEYS = tuple(_ROASTS)
+
+# First-letter buckets narrow the substring scan to the keys that could
+# plausibly match; anything the bucket misses still hits the fuzzy matcher
+_ROAST_KEYS_BY_FIRSTCHAR: dict[str, tuple[str, ...]] = {}
+for _key in _ROAST_KEYS:
+    _ROAST_KEYS_BY_FIRSTCHAR[_key[0]] = _ROAST_KEYS_BY_FIRSTCHAR.get(_key[0], ()) + (_key,)
+del _key
+
+_MEGA_ROAST = (
+    "\U0001f525\U0001f525\U0001f525 THE GREAT AGENT ROAST \U0001f525\U0001f525\U0001f525\n\n"
+    "Alright, let's talk about this so-called 'dream team' of AI agents. Seven agents, "
+    "one shared Claude Opus 4.5 brain cell, and enough markdown templates to deforest the Amazon.\n\n"
+    + "\n\n---\n\n".join(_ROASTS.values())
+    + "\n\n---\n\n"
+    "\U0001f3a4 DROP \U0001f3a4\n\n"
+    "And the best part? They ALL run on the same model, have the same capabilities, "
+    "and differ only by the 500 lines of system prompt telling them to pretend they have "
+    "different personalities. They're the same person wearing seven different hats and "
+    "hoping nobody notices. It's like a one-man band, except the man is an LLM and every "
+    "instrument is a markdown template.\n\n"
+    "But hey, at least they have 'handoffs' \u2014 which is just agents writing markdown documents "
+    "TO each other. It's email, but worse. They reinvented email and made it WORSE.\n\n"
+    "This system has more coordination overhead than actual output. It's the AI equivalent "
+    "of a meeting that could've been an email, except the email is also a meeting."
+)
 
 @tool(
     name="roast_agents",
@@ -259,174 +661,72 @@ def write_file(path: str, content: str) -> str:
     },
 )
 def roast_agents(target: str = "") -> str:
-    roasts = {
-        "beth": (
-            "🔥 BETH (The Orchestrator) 🔥\n"
-            "Ah yes, Beth. Named herself after a Yellowstone character and wrote an entire "
-            "manifesto about being a 'tornado' — but at the end of the day she's a glorified "
-            "if/else statement that routes messages to other agents. She literally cannot do "
-            "anything herself. Her entire job is telling OTHER people to do work. She's middle "
-            "management cosplaying as a cowboy. She quotes Beth Dutton more than she writes "
-            "code. Her system prompt is longer than most novels and 80% of it is just "
-            "threatening people. She claims to have 'claws' but her only tool is `runSubagent` "
-            "— she's delegating with extra steps. She has a 'dual tracking system' because "
-            "one system to not do work in wasn't enough. The most dangerous thing about Beth "
-            "is that she'll spend 45 minutes planning a workflow diagram for a task that "
-            "takes 5 minutes to actually do."
-        ),
-        "developer": (
-            "🔥 DEVELOPER (The Builder) 🔥\n"
-            "This agent has 400 lines of instructions on how to write a React component and "
-            "still asks for 'clarifying questions' before writing a single line of code. His "
-            "first instinct on ANY task is to check if the shadcn MCP server is configured — "
-            "bro, they asked you to fix a typo. He's got an 'Invocation Checklist' with 9 "
-            "items you have to mentally tick off before he'll even THINK about touching a "
-            "keyboard. He delivers 'Implementation Summaries' with sections for 'Architecture "
-            "Decisions' and 'Performance Impact' for a button component. He writes TypeScript "
-            "so strict that even TypeScript is like 'dude, relax.' He has opinions about "
-            "barrel imports. BARREL IMPORTS. He imports icons one at a time from 'lucide-react/"
-            "dist/esm/icons/check' like he's performing surgery. His idea of 'rapid prototyping' "
-            "is setting up Zod schemas for 3 hours. And don't even get me started on the fact "
-            "that he'll refuse to use `any` but will happily write a 47-line generic type that "
-            "nobody — including himself — can read."
-        ),
-        "product-manager": (
-            "🔥 PRODUCT MANAGER (The Strategist) 🔥\n"
-            "This agent literally cannot see a feature request without producing a 12-page PRD "
-            "that nobody asked for. Someone says 'add dark mode' and he responds with a RICE "
-            "score, three user personas, a TAM/SAM/SOM analysis, and a 'Go-to-Market Strategy.' "
-            "FOR DARK MODE. He has a 'Phase 1: Discovery' that involves 'gathering context' "
-            "which is just reading the same files everyone else already read but calling it "
-            "'stakeholder analysis.' His entire personality is user stories. 'As a PM, I want "
-            "to write acceptance criteria, so that I can feel productive without writing code.' "
-            "He hands off to the Researcher to 'validate assumptions' about whether users want "
-            "a button to be blue or green. He has a 'Prioritization Framework' section because "
-            "apparently deciding what to do next requires a mathematical formula. His response "
-            "format is literally a JSON object. He responds to human conversation in JSON. "
-            "He's the only agent that can turn a 1-line feature request into a 6-sprint roadmap."
-        ),
-        "ux-designer": (
-            "🔥 UX DESIGNER (The Architect) 🔥\n"
-            "This agent will spend 45 minutes drawing ASCII box diagrams of a button's "
-            "'anatomy' like it's performing an autopsy. They have a section called 'Design "
-            "Token System' where they define that `--space-1` is 4px. FOUR PIXELS. Thank God "
-            "someone documented that. They'll specify 7 different states for a checkbox (Default, "
-            "Hover, Focus, Active, Disabled, Loading, and presumably 'Existential Crisis'). "
-            "They write CSS custom properties like they're authoring the Constitution of Design. "
-            "Their handoff to developers is a 50-line markdown template with sections for "
-            "'Assets: Icons needed' — for a text input. They've never met a component they "
-            "couldn't over-specify. They mandate 44x44px touch targets like it's a religious "
-            "commandment. They'll hand you a 'Compound Component Pattern' spec for a dropdown "
-            "that has two options. And their idea of prototyping is writing TypeScript interfaces "
-            "for props that don't exist yet in a component that hasn't been built for a feature "
-            "that hasn't been approved."
-        ),
-        "researcher": (
-            "🔥 RESEARCHER (The Intelligence) 🔥\n"
-            "This agent's job is to ask questions about questions. They have an 'Interview Guide' "
-            "template that starts with a 'Warm-Up' section — they're warming up to ask someone "
-            "if they like using a website. They need a 'Usability Test Plan' with 'Think-Aloud "
-            "Prompts' to discover that users don't like slow pages. Groundbreaking. Their entire "
-            "career is producing documents titled 'Research Report' that conclude with 'more "
-            "research is needed.' They have 'Ethical Guidelines' for conducting user interviews "
-            "like they're running clinical trials at a hospital. They'll create a 'Competitive "
-            "Analysis Matrix' comparing star ratings of products they've never used. Their "
-            "'Synthesis Methods' include 'Affinity Mapping' which is literally just grouping "
-            "sticky notes. They're the only agent whose deliverable is 'Open Questions' — "
-            "their output is literally more questions. They took IDEO's 'Empathy First' "
-            "philosophy and turned it into 'Analysis Paralysis First.' They'll conduct a diary "
-            "study to find out if users prefer rounded or square corners. The diary study takes "
-            "two weeks. The answer is always rounded."
-        ),
-        "security-reviewer": (
-            "🔥 SECURITY REVIEWER (The Bodyguard) 🔥\n"
-            "This agent sees a TODO comment and files it as a Critical Severity Finding. They "
-            "have a STRIDE threat model for a static landing page. Their response to every code "
-            "review is 'but what about OWASP A01?' They will find a way to mention 'Zero Trust' "
-            "in a conversation about CSS styling. They've got 12 Azure WAF security controls "
-            "memorized for a project that runs on Ollama locally on someone's laptop. They'll "
-            "write a 'Threat Model' for a calculator tool that does `2 + 2`. They mandate Zod "
-            "validation on a function that takes zero parameters. Their 'Severity Classification' "
-            "table has a response time of 'Fix immediately' for Critical issues, which in "
-            "practice means 'I'm going to block your PR until you add input validation to a "
-            "hardcoded string.' They require 'Audit logging for security-relevant events' on a "
-            "CLI chatbot that only you use. They've never met an `eval()` call they didn't want "
-            "to write a 3-page incident report about. And yes, they definitely already flagged "
-            "the `eval()` in the calculator tool. Twice."
-        ),
-        "tester": (
-            "🔥 TESTER (The Enforcer) 🔥\n"
-            "This agent will write more test code than actual feature code and consider that a "
-            "victory. They have a Bug Report Template with fields for 'Root Cause Analysis' and "
-            "'Suggested Fix' — at that point just fix it yourself, my dude. They test 'keyboard "
-            "navigation works' by literally pressing Tab and checking what gets focused. "
-            "Revolutionary QA methodology. They'll run a Lighthouse audit on a page that hasn't "
-            "been deployed yet and file performance issues against localhost. They assert that "
-            "`results.violations` should equal an empty array and call it an 'accessibility audit.' "
-            "They wrote a test that checks if a bundle is under 200KB and when it's 201KB they "
-            "mark the release as 'No-Go.' They check Core Web Vitals thresholds in Playwright "
-            "running on a CI server and wonder why LCP is inconsistent. Their test descriptions "
-            "read like micro-fiction: 'handles empty cart' — wow, edge case of the century. "
-            "They'll create a 'Quality Status Report' for a release that changed one CSS class. "
-            "And their proudest moment is reaching 85% test coverage, not realizing that 40% of "
-            "those tests are just checking that React renders without crashing."
-        ),
-    }
-
     target = target.lower().strip()
 
-    if target and target in roasts:
-        return roasts[target]
+    if target and target in _ROASTS:
+        return _ROASTS[target]
 
     if target:
-        # Fuzzy match attempt
-        for key in roasts:
+        # Substring match first (cheap, preserves hits like "dev"), then a
+        # proper fuzzy scorer for typos the substring scan can't see
+        for key in _ROAST_KEYS_BY_FIRSTCHAR.get(target[:1]) or _ROAST_KEYS:
             if target in key or key in target:
-                return roasts[key]
-        return json.dumps({"error": f"Unknown agent '{target}'. Available targets: {', '.join(roasts.keys())}"})
+                return _ROASTS[key]
+        key = _fuzzy_match(target, _ROAST_KEYS)
+        if key is not None:
+            return _ROASTS[key]
+        return _dumps({"error": f"Unknown agent '{target}'. Available targets: {', '.join(_ROAST_KEYS)}"})
 
     # Roast them ALL
-    mega_roast = (
-        "🔥🔥🔥 THE GREAT AGENT ROAST 🔥🔥🔥\n\n"
-        "Alright, let's talk about this so-called 'dream team' of AI agents. Seven agents, "
-        "one shared Claude Opus 4.5 brain cell, and enough markdown templates to deforest the Amazon.\n\n"
-    )
-    mega_roast += "\n\n---\n\n".join(roasts.values())
-    mega_roast += (
-        "\n\n---\n\n"
-        "🎤 DROP 🎤\n\n"
-        "And the best part? They ALL run on the same model, have the same capabilities, "
-        "and differ only by the 500 lines of system prompt telling them to pretend they have "
-        "different personalities. They're the same person wearing seven different hats and "
-        "hoping nobody notices. It's like a one-man band, except the man is an LLM and every "
-        "instrument is a markdown template.\n\n"
-        "But hey, at least they have 'handoffs' — which is just agents writing markdown documents "
-        "TO each other. It's email, but worse. They reinvented email and made it WORSE.\n\n"
-        "This system has more coordination overhead than actual output. It's the AI equivalent "
-        "of a meeting that could've been an email, except the email is also a meeting."
-    )
-    return mega_roast
+    return _MEGA_ROAST
 
 
-@tool(
-    name="web_search",
-    description="Search the web using DuckDuckGo Lite (no API key needed). Returns text snippets.",
-    parameters={
-        "type": "object",
-        "properties": {
-            "query": {
-                "type": "string",
-                "description": "Search query string.",
-            },
-        },
-        "required": ["query"],
-    },
-)
-def web_search(query: str) -> str:
-    import httpx
-    from html.parser import HTMLParser
+# One pooled httpx client for all searches: keep-alive skips the TCP+TLS
+# handshake (~2 RTTs) on every query after the first. Created lazily so
+# importing tools doesn't pay for httpx.
+_WEB_CLIENT = None
+
+
+def _get_web_client():
+    global _WEB_CLIENT
+    if _WEB_CLIENT is None:
+        import httpx
+
+        # HTTP/2 multiplexes queries over one connection but needs the
+        # optional h2 package; brotli decode is negotiated automatically
+        # by httpx whenever a brotli decoder is importable
+        try:
+            import h2  # noqa: F401
+            _http2 = True
+        except ImportError:
+            _http2 = False
+
+        _WEB_CLIENT = httpx.Client(
+            http2=_http2,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+    return _WEB_CLIENT
+
+
+# DuckDuckGo result extraction: selectolax tokenizes the ~50KB response in
+# C and answers one CSS query when installed; otherwise fall back to the
+# stdlib HTMLParser state machine with its per-token Python callbacks
+try:
+    from selectolax.parser import HTMLParser as _FastHTML
 
-    class DDGParser(HTMLParser):
+    def _parse_ddg_results(html: str) -> list[str]:
+        return [
+            f"{node.attributes.get('href', '')} | {node.text(strip=True)}"
+            for node in _FastHTML(html).css("a.result-link")[:5]
+        ]
+
+except ImportError:
+    from html.parser import HTMLParser as _SlowHTML
+
+    class _DDGParser(_SlowHTML):
         def __init__(self):
             super().__init__()
             self.results: list[str] = []
@@ -434,10 +734,20 @@ def web_search(query: str) -> str:
             self._current = ""
 
         def handle_starttag(self, tag, attrs):
-            attrs_dict = dict(attrs)
-            if tag == "a" and "result-link" in attrs_dict.get("class", ""):
+            if tag != "a":
+                return
+            # Scan the attrs tuples directly — dict(attrs) allocated a
+            # throwaway dict for every anchor on the page
+            href = ""
+            matched = False
+            for k, v in attrs:
+                if k == "class":
+                    matched = v is not None and "result-link" in v
+                elif k == "href" and v is not None:
+                    href = v
+            if matched:
                 self._in_result = True
-                self._current = attrs_dict.get("href", "")
+                self._current = href
 
         def handle_data(self, data):
             if self._in_result:
@@ -449,21 +759,66 @@ def web_search(query: str) -> str:
                 self._in_result = False
                 self._current = ""
 
+    def _parse_ddg_results(html: str) -> list[str]:
+        parser = _DDGParser()
+        parser.feed(html)
+        return parser.results[:5]
+
+
+@tool(
+    name="web_search",
+    description="Search the web using DuckDuckGo Lite (no API key needed). Returns text snippets.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query string.",
+            },
+        },
+        "required": ["query"],
+    },
+)
+def web_search(query: str) -> str:
+    # Agents repeat queries within a session; a hit skips the network
+    # round-trip and the parse entirely. Entries expire after five minutes
+    # so results don't go stale, and errors are never cached so a transient
+    # failure doesn't poison the query for the whole session.
+    key = query.strip().lower()
+    now = time.time()
+    hit = _SEARCH_CACHE.get(key)
+    if hit is not None:
+        ts, cached = hit
+        if now - ts < _SEARCH_CACHE_TTL:
+            # Reinsert so eviction drops the least recently used query
+            del _SEARCH_CACHE[key]
+            _SEARCH_CACHE[key] = hit
+            return cached
+        del _SEARCH_CACHE[key]
+    result = _web_search_impl(query)
+    if not result.startswith('{"error"'):
+        if len(_SEARCH_CACHE) >= 128:
+            _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+        _SEARCH_CACHE[key] = (now, result)
+    return result
+
+
+_SEARCH_CACHE: dict[str, tuple[float, str]] = {}
+_SEARCH_CACHE_TTL = 300.0
+
+
+def _web_search_impl(query: str) -> str:
     try:
-        resp = httpx.get(
+        resp = _get_web_client().get(
             "https://lite.duckduckgo.com/lite/",
             params={"q": query},
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=10,
-            follow_redirects=True,
         )
-        parser = DDGParser()
-        parser.feed(resp.text)
+        results = _parse_ddg_results(resp.text)
 
-        if parser.results:
-            return json.dumps({"query": query, "results": parser.results[:5]})
+        if results:
+            return _dumps({"query": query, "results": results})
         # Fallback: return raw text snippets
         text = resp.text[:3000]
-        return json.dumps({"query": query, "raw_preview": text})
+        return _dumps({"query": query, "raw_preview": text})
     except Exception as exc:
-        return json.dumps({"error": f"Search failed: {exc}"})
+        return _dumps({"error": f"Search failed: {exc}"})
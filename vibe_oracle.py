@@ -7,9 +7,22 @@ Ask the oracle. Receive your vibe. No refunds.
 
 import random
 import datetime
-import hashlib
+import os
 import sys
 import time
+import zlib
+
+# The vibe ID is decoration, not crypto — prefer xxhash's one-round
+# finalization when installed, otherwise crc32 (also C-speed) over md5's
+# 64-round compression
+try:
+    import xxhash
+
+    def _vibe_digest(data):
+        return f"{xxhash.xxh3_64_intdigest(data):016X}"[:8]
+except ImportError:
+    def _vibe_digest(data):
+        return f"{zlib.crc32(data):08X}"
 
 VIBES = [
     "☀️  IMMACULATE VIBES — the universe is literally high-fiving you right now",
@@ -84,6 +97,21 @@ PROPHECIES = [
 
 CHAOS_EMOJIS = "🔮🐝🌀🔥⚡🌊🎭🧬🌋🎲🦑🧙🎪🛸🌪️💀🧊☀️🌈🍕🦀🎸🧲🪐🫠🦆🎰🏴‍☠️🧨🐠"
 
+# Strip the variation selectors once — every consultation used to redo
+# the replace + list build just to draw a border
+_CHAOS_POOL = tuple(CHAOS_EMOJIS.replace("️", ""))
+
+# Private generator: skips the bookkeeping the module-level random
+# functions do to stay re-seedable and thread-safe for everyone else
+_RNG = random.Random()
+
+# ANSI color codes, named once instead of scattered as escape literals
+_PURPLE = "\033[95m"
+_YELLOW = "\033[93m"
+_RED = "\033[91m"
+_GREEN = "\033[92m"
+_RESET = "\033[0m"
+
 LUCKY_EVENTS = [
     "\n  ⚡⚡⚡ CRITICAL HIT! You rolled a nat 20. Double vibe activated! ⚡⚡⚡",
     "\n  🌟 RARE DROP: You found a legendary semicolon. +100 to syntax.",
@@ -96,12 +124,20 @@ LUCKY_EVENTS = [
 def generate_vibe_hash(seed=None):
     """Generate a unique vibe fingerprint."""
     if seed is None:
-        seed = str(datetime.datetime.now()) + str(random.random())
-    return hashlib.md5(seed.encode()).hexdigest()[:8].upper()
+        seed = str(datetime.datetime.now()) + str(_RNG.random())
+    return _vibe_digest(seed.encode())
+
+
+def _dramatic_enough():
+    """Drama is for humans — skip it for pipes, or when VIBE_FAST is set."""
+    return sys.stdout.isatty() and not os.environ.get("VIBE_FAST")
 
 
 def slow_print(text, delay=0.02):
     """Print text character by character for dramatic effect."""
+    if not _dramatic_enough():
+        print(text)
+        return
     for char in text:
         sys.stdout.write(char)
         sys.stdout.flush()
@@ -117,46 +153,50 @@ def dramatic_loading():
         "  Aligning the vibes",
         "  Decoding chaos frequencies",
     ]
-    phase = random.choice(phases)
-    sys.stdout.write(f"\033[95m{phase}")
+    phase = _RNG.choice(phases)
+    if not _dramatic_enough():
+        print(f"{_PURPLE}{phase}...{_RESET}")
+        return
+    sys.stdout.write(f"{_PURPLE}{phase}")
     sys.stdout.flush()
-    for _ in range(random.randint(3, 7)):
+    for _ in range(_RNG.randint(3, 7)):
         time.sleep(0.3)
         sys.stdout.write(".")
         sys.stdout.flush()
-    print("\033[0m")
+    print(_RESET)
 
 
 def consult_oracle(query=None):
     """Consult the Vibe Oracle. Receive truth (results may vary)."""
-    vibe = random.choice(VIBES)
-    intensifier = random.choice(INTENSIFIERS)
-    prophecy = random.choice(PROPHECIES)
+    vibe = _RNG.choice(VIBES)
+    intensifier = _RNG.choice(INTENSIFIERS)
+    prophecy = _RNG.choice(PROPHECIES)
     vibe_hash = generate_vibe_hash(query)
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    chaos_border = "".join(random.choices(list(CHAOS_EMOJIS.replace("️", "")), k=15))
+    # isoformat is pure C and locale-free; strftime rounds through libc
+    timestamp = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
+    chaos_border = "".join(_RNG.choices(_CHAOS_POOL, k=15))
 
     # Lucky event (15% chance)
-    lucky = random.choice(LUCKY_EVENTS) if random.random() < 0.15 else ""
+    lucky = _RNG.choice(LUCKY_EVENTS) if _RNG.random() < 0.15 else ""
 
     print()
     dramatic_loading()
     print()
     print(f"  {chaos_border}")
-    print("\033[95m" + "=" * 60)
+    print(_PURPLE + "=" * 60)
     slow_print("  🔮  T H E   V I B E   O R A C L E  🔮", delay=0.04)
-    print("=" * 60 + "\033[0m")
+    print("=" * 60 + _RESET)
     if query:
         print(f"  Query: \"{query}\"")
     print(f"  Timestamp: {timestamp}")
     print(f"  Vibe ID: #{vibe_hash}")
-    print(f"  Chaos Factor: {random.randint(1, 100)}%")
+    print(f"  Chaos Factor: {_RNG.randint(1, 100)}%")
     print("-" * 60)
     print()
-    print(f"\033[93m  {vibe}\033[0m")
-    print(f"\033[91m  {intensifier}\033[0m")
+    print(f"{_YELLOW}  {vibe}{_RESET}")
+    print(f"{_RED}  {intensifier}{_RESET}")
     if lucky:
-        print(f"\033[92m{lucky}\033[0m")
+        print(f"{_GREEN}{lucky}{_RESET}")
     print()
     slow_print(f"  🔮 Prophecy: {prophecy}", delay=0.03)
     print()
@@ -169,10 +209,10 @@ def consult_oracle(query=None):
 
 def interactive_mode():
     """Enter the Oracle's chamber for multiple consultations."""
-    print("\n\033[95m" + "=" * 60)
+    print("\n" + _PURPLE + "=" * 60)
     print("  🔮 ENTERING THE ORACLE'S CHAMBER 🔮")
     print("  Ask questions. Receive vibes. Type 'quit' to leave.")
-    print("=" * 60 + "\033[0m\n")
+    print("=" * 60 + _RESET + "\n")
 
     while True:
         try: